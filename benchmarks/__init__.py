@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for DIY Lang. Run them from the root of the repository, e.g.
+
+    $ python -m benchmarks.parse_scaling
+"""
+
+import timeit
+
+
+def best_of(function, repeat=3):
+    """Time `function` a few times, and return the fastest run in seconds."""
+    return min(timeit.repeat(function, number=1, repeat=repeat))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares loading the ASTs of a file from the `__diycache__` with parsing it
+from scratch, for the standard library and for a large generated program.
+"""
+
+import os
+import shutil
+import tempfile
+from os.path import dirname, join
+
+from diylang.cache import cache_path, read_cached
+from diylang.parser import read_file
+
+from . import best_of
+
+STDLIB = join(dirname(__file__), '..', 'stdlib.diy')
+
+
+def write_program(filename, forms):
+    with open(filename, 'w') as sourcefile:
+        for i in range(forms):
+            sourcefile.write(
+                '(define f%d (lambda (n) ; generated\n'
+                '  (if (eq n 0) "done" (cons n (f%d (- n 1))))))\n' % (i, i))
+
+
+def report(name, filename):
+    parsed = best_of(lambda: list(read_file(filename)))
+    list(read_cached(filename))  # make sure the cache is there
+    cached = best_of(lambda: list(read_cached(filename)))
+    print("%-8s %9d bytes  parse %8.2f ms  cached %8.2f ms  %5.1fx" %
+          (name, os.path.getsize(filename), parsed * 1e3, cached * 1e3,
+           parsed / cached))
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        stdlib = join(directory, 'stdlib.diy')
+        shutil.copy(STDLIB, stdlib)
+        report("stdlib", stdlib)
+
+        program = join(directory, 'program.diy')
+        write_program(program, 50000)
+        report("program", program)
+        print("cache:   %9d bytes" % os.path.getsize(cache_path(program)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+"""
+Times printing the huge integers of big factorials with `unparse`, against
+Python's own `str`, which has to be allowed to print that many digits first.
+Python's conversion is quadratic, so its time grows about four times with
+every doubling of the digits, while `unparse` grows far slower.
+"""
+
+import math
+import sys
+
+from diylang.parser import unparse
+
+from . import best_of
+
+
+def main():
+    limit = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    set_limit = getattr(sys, 'set_int_max_str_digits', lambda digits: None)
+    for n in [5000, 10000, 20000, 40000, 80000]:
+        value = math.factorial(n)
+        printed = best_of(lambda: unparse(value))
+        set_limit(0)
+        try:
+            python = best_of(lambda: str(value))
+        finally:
+            set_limit(limit)
+        hexadecimal = best_of(lambda: unparse(value, True))
+        print("(fact %5d) %7d digits  unparse %8.2f ms  str %8.2f ms  "
+              "hex %6.2f ms" % (n, len(unparse(value)), printed * 1e3,
+                                python * 1e3, hexadecimal * 1e3))
+
+
+if __name__ == '__main__':
+    main()
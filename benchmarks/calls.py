@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+Times call-heavy programs, which spend most of their time dispatching on the
+head of list nodes and looking up symbols in the environment.
+"""
+
+import sys
+from os.path import dirname, join
+
+from diylang.evaluator import evaluate
+from diylang.interpreter import interpret_file
+from diylang.parser import parse, parse_multiple
+from diylang.types import Environment
+
+from . import best_of
+
+STDLIB = join(dirname(__file__), '..', 'stdlib.diy')
+
+DEFINITIONS = """
+(define fact
+    (lambda (n)
+        (if (eq n 0) 1 (* n (fact (- n 1))))))
+(define fib
+    (lambda (n)
+        (if (> 2 n) n (+ (fib (- n 1)) (fib (- n 2))))))
+"""
+
+PROGRAMS = [
+    ("fact", "(fact 150)", 20),
+    ("fib", "(fib 18)", 1),
+    ("length", "(length (range 1 150))", 20),
+    ("sort", "(sort (reverse (range 1 60)))", 5),
+    ("map", "(map (lambda (x) (* x x)) (range 1 150))", 20),
+    ("reduce", "(reduce (lambda (a b) (+ a b)) 0 (range 1 150))", 20),
+]
+
+
+def environment():
+    env = Environment()
+    interpret_file(STDLIB, env)
+    for ast in parse_multiple(DEFINITIONS):
+        evaluate(ast, env)
+    return env
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    env = environment()
+    for name, source, repeat in PROGRAMS:
+        ast = parse(source)
+
+        def run():
+            for _ in range(repeat):
+                evaluate(ast, env)
+
+        seconds = best_of(run, 5)
+        print("%-8s %-48s %8.2f ms" % (name, source, seconds * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Generates a corpus of DIY Lang sources which stress different parts of the
+reader. Each generator takes a `scale`, the approximate size in bytes of the
+source to make.
+
+Write the corpus to a directory to have a look at it, or to feed it to other
+tools:
+
+    $ python -m benchmarks.corpus /tmp/corpus 1000000
+"""
+
+import os
+import sys
+from os.path import join
+
+
+def deeply_nested(scale):
+    """One list nested as deep as the scale allows."""
+    depth = max(1, scale // 8)
+    return "(a 1 " * depth + "'b" + ")" * depth
+
+
+def wide_list(scale):
+    """One quoted list of very many atoms."""
+    count = max(1, scale // 8)
+    return "'(" + " ".join("s%d" % (i % 100000) for i in range(count)) + ")"
+
+
+def long_strings(scale):
+    """Few, very long strings with escaped quotes and parens in them."""
+    piece = 'he said \\"(hello)\\" and left; '
+    count = 8
+    text = piece * max(1, scale // (count * len(piece)))
+    return "(list " + " ".join('"%s"' % text for _ in range(count)) + ")"
+
+
+def comment_heavy(scale):
+    """Small forms drowned in comments."""
+    lines = []
+    size = 0
+    i = 0
+    while size < scale:
+        line = ("  ;; comment %d; with (parens) and \"quotes\"\n"
+                "  (define x%d (+ %d 1)) ; trailing comment\n" % (i, i, i))
+        lines.append(line)
+        size += len(line)
+        i += 1
+    return "".join(lines)
+
+
+def quoted_dataset(scale):
+    """A large quoted dataset, of the kind programs load as literals."""
+    rows = []
+    size = 0
+    i = 0
+    while size < scale:
+        row = '  (row %d "name %d" #t (tags a b c) (%d %d))\n' % (
+            i, i, i * 2, i * 3)
+        rows.append(row)
+        size += len(row)
+        i += 1
+    return "(define data '(\n" + "".join(rows) + "))\n"
+
+
+GENERATORS = [
+    ("deeply_nested", deeply_nested),
+    ("wide_list", wide_list),
+    ("long_strings", long_strings),
+    ("comment_heavy", comment_heavy),
+    ("quoted_dataset", quoted_dataset),
+]
+
+
+def corpus(scale):
+    """Returns (name, source) of every source in the corpus."""
+    return [(name, generate(scale)) for name, generate in GENERATORS]
+
+
+def main(directory, scale=1000000):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    for name, source in corpus(scale):
+        with open(join(directory, name + ".diy"), "w") as sourcefile:
+            sourcefile.write(source)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], *[int(arg) for arg in sys.argv[2:]])
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the engines of `interpreter.ENGINES` on a few call-heavy programs
+using the stdlib.
+"""
+
+import sys
+
+from diylang.interpreter import ENGINES, interpret_file
+from diylang.parser import parse, parse_multiple
+from diylang.types import Environment
+
+from . import best_of
+from .calls import DEFINITIONS, STDLIB
+
+PROGRAMS = [
+    ("fact", "(fact 150)", 20),
+    ("fib", "(fib 18)", 1),
+    ("sort", "(sort (reverse (range 1 60)))", 5),
+    ("reverse", "(reverse (range 1 150))", 5),
+]
+
+
+def environment(engine):
+    env = Environment()
+    interpret_file(STDLIB, env, engine=engine)
+    evaluate = ENGINES[engine]
+    for ast in parse_multiple(DEFINITIONS):
+        evaluate(ast, env)
+    return env
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    engines = sorted(ENGINES)
+    print("%-8s" % "" + "".join("%12s" % engine for engine in engines))
+    for name, source, repeat in PROGRAMS:
+        ast = parse(source)
+        timings = []
+        for engine in engines:
+            evaluate, env = ENGINES[engine], environment(engine)
+
+            def run():
+                for _ in range(repeat):
+                    evaluate(ast, env)
+
+            timings.append(best_of(run, 5))
+        print("%-8s" % name +
+              "".join("%9.2f ms" % (seconds * 1e3) for seconds in timings))
+
+
+if __name__ == '__main__':
+    main()
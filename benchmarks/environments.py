@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the cost of calling a closure, and of a `let`, with more and more
+globals defined around them. As extending an environment copies none of
+the variables around it, it should stay the same.
+"""
+
+from diylang.evaluator import evaluate
+from diylang.parser import parse
+from diylang.types import Environment
+
+from . import best_of
+
+GLOBALS = [10, 1000, 10000, 100000]
+
+PROGRAMS = [
+    ("call", "(define add (lambda (a b) (+ a b)))", "(add 1 2)"),
+    ("let", None, "(let ((a 1) (b 2)) (+ a b))"),
+]
+
+REPEAT = 1000
+
+
+def main():
+    for name, definition, source in PROGRAMS:
+        ast = parse(source)
+        for size in GLOBALS:
+            env = Environment(dict(("g%d" % i, i) for i in range(size)))
+            if definition is not None:
+                evaluate(parse(definition), env)
+
+            def run():
+                for _ in range(REPEAT):
+                    evaluate(ast, env)
+
+            seconds = best_of(run) / REPEAT
+            print("%-4s with %6d globals: %8.2f us" %
+                  (name, size, seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares parsing a file again after a small edit in full with parsing only
+the expressions the edit touched, through `ParsedText.edit`, for files of
+growing size. The time of the latter should hardly grow with the file, but
+for copying the text.
+"""
+
+from benchmarks import best_of
+from diylang.parser import ParsedText, parse_multiple
+
+
+def source(definitions):
+    return ''.join('(define (f%d x) (if (> x %d) "big" \'(small x))) ; f%d\n'
+                   % (i, i, i) for i in range(definitions))
+
+
+def main():
+    for definitions in (1000, 10000, 100000):
+        text = source(definitions)
+        parsed = ParsedText(text)
+        middle = text.index('(define (f%d ' % (definitions // 2))
+        edit = (middle + 1, middle + 7, 'defn')
+        undo = (middle + 1, middle + 5, 'define')
+        full = best_of(lambda: parse_multiple(
+            text[:edit[0]] + edit[2] + text[edit[1]:]))
+        # each run makes the edit and takes it back, so the next one can
+        # make it again
+        incremental = best_of(
+            lambda: (parsed.edit(*edit), parsed.edit(*undo))) / 2
+        print("%6d definitions: full %.4fs, incremental %.4fs" %
+              (definitions, full, incremental))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""
+Times recursive stdlib functions with the closure engine, and shows how many
+of the calls of globals found the closure in the inline cache of the call
+site, rather than looking it up in the environment. Counting the calls takes
+time of its own, so the times are with counting turned on.
+"""
+
+import sys
+
+from diylang.compiler import INLINE_CACHES, compile_ast
+from diylang.interpreter import interpret_file
+from diylang.parser import parse
+from diylang.types import Environment
+
+from . import best_of
+from .calls import STDLIB
+
+PROGRAMS = [
+    ("length", "(length l)", 20),
+    ("sum", "(sum l)", 20),
+    ("reverse", "(reverse (range 1 150))", 5),
+    ("sort", "(sort (reverse (range 1 60)))", 5),
+]
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    env = Environment()
+    # count in all the code compiled from here on, which slows it down
+    INLINE_CACHES.counting = True
+    interpret_file(STDLIB, env, engine='closure')
+    env.redefine('l', list(range(500)))
+    for name, source, repeat in PROGRAMS:
+        code = compile_ast(parse(source))
+
+        def run():
+            for _ in range(repeat):
+                code(env)
+
+        INLINE_CACHES.clear()
+        seconds = best_of(run, 5)
+        print("%-8s %9.2f ms   %d hits, %d misses" % (
+            name, seconds * 1e3, INLINE_CACHES.hits, INLINE_CACHES.misses))
+
+
+if __name__ == '__main__':
+    main()
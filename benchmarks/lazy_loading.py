@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares loading a large library of definitions eagerly with loading it
+lazily, where only the definitions a program actually uses get parsed and
+evaluated. Both load the source as-is, without the AST cache.
+"""
+
+import os
+import tempfile
+
+from benchmarks import best_of
+from diylang.evaluator import evaluate
+from diylang.interpreter import interpret, interpret_file
+from diylang.parser import read_file
+from diylang.types import Environment
+
+
+def write_library(filename, definitions):
+    with open(filename, 'w') as sourcefile:
+        for i in range(definitions):
+            sourcefile.write(
+                "(define f%d\n"
+                "  (lambda (x)\n"
+                "    (if (eq x 0) '(%d \"result\" #t) (f%d (- x 1)))))\n" %
+                (i, i, i))
+
+
+def load_eagerly(filename):
+    env = Environment()
+    for ast in read_file(filename):
+        evaluate(ast, env)
+    return env
+
+
+def load_lazily(filename):
+    env = Environment()
+    interpret_file(filename, env, lazy=True)
+    return env
+
+
+def main(definitions=20000):
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    os.close(handle)
+    try:
+        write_library(filename, definitions)
+        print("source: %.1f MB, %d definitions" %
+              (os.path.getsize(filename) / 1e6, definitions))
+        for load in (load_eagerly, load_lazily):
+            def run():
+                interpret("(f7 3)", load(filename))
+            print("%-12s %.3fs" % (load.__name__, best_of(run)))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares peak memory of reading a large, literal-heavy file through the
+memory-mapped reader with reading it into a string first. The mapped reader
+should peak at about the size of the ASTs, as measured by `ast_size`.
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from diylang.parser import parse_multiple, read_file
+
+
+def write_literals(filename, rows):
+    with open(filename, 'w') as sourcefile:
+        sourcefile.write("(define data '(\n")
+        for i in range(rows):
+            sourcefile.write('  (row %d "name %d" #t (%d %d)) ; row\n' %
+                             (i, i, i * 2, i * 3))
+        sourcefile.write("))\n")
+
+
+def ast_size(ast):
+    size = sys.getsizeof(ast)
+    if isinstance(ast, list):
+        size += sum(ast_size(x) for x in ast)
+    return size
+
+
+def peak(function):
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def from_string(filename):
+    with open(filename, 'r') as sourcefile:
+        return parse_multiple(sourcefile.read())
+
+
+def main(rows=200000):
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    os.close(handle)
+    try:
+        write_literals(filename, rows)
+        print("source: %.1f MB" % (os.path.getsize(filename) / 1e6))
+        asts, mapped = peak(lambda: list(read_file(filename)))
+        print("asts:   %.1f MB" % (ast_size(asts) / 1e6))
+        del asts
+        print("mapped: %.1f MB peak" % (mapped / 1e6))
+        _, string = peak(lambda: from_string(filename))
+        print("string: %.1f MB peak" % (string / 1e6))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the speedup of parsing a large generated file in a pool of worker
+processes, by number of workers, over reading it in a single process.
+
+    $ python -m benchmarks.parallel_parsing [megabytes]
+"""
+
+import os
+import sys
+import tempfile
+
+from benchmarks import best_of
+from diylang.parallel import read_parallel
+from diylang.parser import read_file
+
+
+def write_source(filename, megabytes):
+    row = ('(define (row%d) (list %d "name" #t \'(a b (c d)) ; comment\n'
+           '  (lambda (x y) (if (> x y) (+ x 1) (- y 1)))))\n')
+    with open(filename, 'w') as sourcefile:
+        i = 0
+        while sourcefile.tell() < megabytes * 1e6:
+            sourcefile.write(row % (i, i))
+            i += 1
+
+
+def consume(asts):
+    for _ in asts:
+        pass
+
+
+def main(megabytes=50):
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    os.close(handle)
+    try:
+        write_source(filename, megabytes)
+        print("source: %.1f MB, %d cores" %
+              (os.path.getsize(filename) / 1e6, os.cpu_count()))
+        serial = best_of(lambda: consume(read_file(filename)))
+        print("read_file:       %.2fs" % serial)
+        workers = 1
+        while workers <= 2 * (os.cpu_count() or 1):
+            elapsed = best_of(
+                lambda: consume(read_parallel(filename, workers)))
+            print("%2d worker(s):    %.2fs  %.2fx" %
+                  (workers, elapsed, serial / elapsed))
+            workers *= 2
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    main(*[float(arg) for arg in sys.argv[1:]])
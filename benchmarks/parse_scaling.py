@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shows that parsing time grows linearly with the size of the source, both for
+many flat top-level forms and for a single deeply nested one. The last column,
+time per kilobyte of source, should stay roughly constant as sizes double.
+"""
+
+from diylang.parser import parse, parse_multiple
+
+from . import best_of
+
+
+def flat_source(forms):
+    return "\n".join("(define x%d (+ %d 1)) ; form %d" % (i, i, i)
+                     for i in range(forms))
+
+
+def nested_source(depth):
+    return "(a " * depth + "'b \"str ( )\"" + ")" * depth
+
+
+def report(name, function, source):
+    seconds = best_of(lambda: function(source))
+    print("%-8s %10d bytes %9.4f s %8.2f us/kB" %
+          (name, len(source), seconds, seconds * 1e6 / (len(source) / 1e3)))
+
+
+def main():
+    for forms in [2500, 5000, 10000, 20000, 40000]:
+        report("flat", parse_multiple, flat_source(forms))
+    for depth in [2500, 5000, 10000, 20000, 40000]:
+        report("nested", parse, nested_source(depth))
+
+
+if __name__ == '__main__':
+    main()
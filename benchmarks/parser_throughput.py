@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures throughput and peak memory of the reader and unparser on the corpus
+of `benchmarks.corpus`, and prints one JSON object per corpus and operation,
+for comparing runs before and after a change:
+
+    $ python -m benchmarks.parser_throughput --scale 1000000 > bench.jsonl
+
+`parse` reads one expression only, so it is given the corpus wrapped in a
+list. `unparse` is measured by the size of the source it makes.
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+
+from diylang.parser import parse, parse_multiple, split_exps, unparse
+
+from . import best_of
+from .corpus import corpus
+
+
+def operations(source):
+    """Returns (name, function, bytes handled) of each operation timed."""
+    wrapped = "(" + source + ")"
+    asts = parse_multiple(source)
+    size = len(unparse(asts)) - 2
+    return [
+        ("parse", lambda: parse(wrapped), len(wrapped)),
+        ("parse_multiple", lambda: parse_multiple(source), len(source)),
+        ("split_exps", lambda: split_exps(source), len(source)),
+        ("unparse", lambda: unparse(asts), size),
+    ]
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", type=int, default=1000000,
+                        help="approximate size of each source, in bytes")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs of each operation, the fastest counts")
+    args = parser.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+    for name, source in corpus(args.scale):
+        for operation, function, size in operations(source):
+            seconds = best_of(function, args.repeat)
+            print(json.dumps({
+                "corpus": name,
+                "operation": operation,
+                "bytes": size,
+                "seconds": round(seconds, 6),
+                "mb_per_s": round(size / seconds / 1e6, 3),
+                "peak_bytes": peak_memory(function),
+            }, sort_keys=True))
+            sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
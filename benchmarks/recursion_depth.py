@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the tree-walking evaluator with the explicit-stack machine on the
+recursive stdlib function `length`, for lists short enough for both, and
+for lists too long for the Python stack of the evaluator.
+"""
+
+from diylang.interpreter import ENGINES, interpret_file
+from diylang.parser import parse
+from diylang.types import Environment
+
+from . import best_of
+from .calls import STDLIB
+
+SIZES = [(50, 100), (500, 10), (5000, 1)]
+
+
+def main():
+    env = Environment()
+    interpret_file(STDLIB, env)
+    program = parse("(length l)")
+    for size, repeat in SIZES:
+        env.bindings['l'] = list(range(size))
+        timings = []
+        for engine in ('tree', 'stack'):
+            evaluate = ENGINES[engine]
+
+            def run():
+                for _ in range(repeat):
+                    evaluate(program, env)
+
+            try:
+                seconds = best_of(run)
+            except RecursionError:
+                timings.append("%12s" % "too deep")
+            else:
+                timings.append("%9.2f ms" % (seconds / repeat * 1e3))
+        print("length of %5d: tree %s, stack %s" % ((size,) + tuple(timings)))
+
+
+if __name__ == '__main__':
+    main()
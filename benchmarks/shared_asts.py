@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the memory held by the ASTs of a large quoted dataset, read as
+ordinary lists and read with `shared=True`, where identical subtrees,
+integers and strings are stored once.
+"""
+
+import tracemalloc
+
+from diylang.parser import parse_multiple
+
+from . import best_of
+
+
+def dataset(rows):
+    lines = ["(define data '("]
+    for i in range(rows):
+        lines.append('  (row %d (status "active") (tags (a b c)) (score %d))' %
+                     (i, i % 10))
+    lines.append("))")
+    return "\n".join(lines)
+
+
+def retained(function):
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main(rows=100000):
+    source = dataset(rows)
+    print("source: %7.1f MB" % (len(source) / 1e6))
+    for shared in [False, True]:
+        asts, size = retained(lambda: parse_multiple(source, shared))
+        del asts
+        seconds = best_of(lambda: parse_multiple(source, shared))
+        print("shared=%-5s %7.1f MB retained, parsed in %.2f s" %
+              (shared, size / 1e6, seconds))
+
+
+if __name__ == '__main__':
+    main()
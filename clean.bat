@@ -1,2 +1,3 @@
 del /s *.bak
 del /s *.pyc
+del /s *.diyc
@@ -17,7 +17,8 @@ def is_string(x):
 
 
 def is_list(x):
-    return isinstance(x, list)
+    # `SharedList` tuples are the lists of ASTs read with `shared=True`
+    return isinstance(x, (list, tuple))
 
 
 def is_boolean(x):
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import pickle
+import struct
+from collections import OrderedDict
+from os.path import basename, dirname, join, splitext
+from sys import intern
+
+from .ast import is_list
+from .parser import parse, read_file
+from .types import String
+
+"""
+Caches of parsed DIY Lang source, so the same source need not be parsed over
+and over again.
+
+`ParseCache` keeps the ASTs of the source strings parsed most recently.
+
+The on-disk cache of parsed files is much like Python's `__pycache__`. The
+ASTs of `lib/foo.diy` are kept in `lib/__diycache__/foo.diylang-4.diyc`. A
+cache file starts with a hash of the source it was parsed from, and is only
+used while that hash still matches the source. Then comes one pickle per
+top-level expression, in order, with the symbols kept apart from the rest,
+so they are interned again as they are loaded. Each pickle stands on its
+own, so the ASTs are written and loaded one at a time, and only the one in
+hand is kept. The file ends in a trailer with the number of expressions,
+which is checked before any of them is used, so a cache file which was cut
+short is never read.
+"""
+
+# Bump this whenever the reader changes what ASTs it makes for some source,
+# or the ASTs are pickled differently.
+VERSION = 4
+
+CACHE_DIR = '__diycache__'
+
+MAGIC = b'DIYC'
+
+# The trailer, followed by the number of expressions as 8 bytes.
+END = b'DIYE'
+
+_COUNT = struct.Struct('<Q')
+
+_HASH = hashlib.sha256
+
+# The pickle protocol of cache files, the same for every version of Python
+# which runs DIY Lang, so they can all read each other's caches.
+PROTOCOL = 4
+
+# What loading a cache file which is truncated, or otherwise broken, raises.
+_BROKEN = (pickle.UnpicklingError, EOFError, ValueError, TypeError,
+           IndexError, KeyError, AttributeError, RecursionError)
+
+
+def cache_path(filename):
+    """Where the cached ASTs of a source file are kept."""
+    name = splitext(basename(filename))[0]
+    return join(dirname(filename), CACHE_DIR,
+                '%s.diylang-%d.diyc' % (name, VERSION))
+
+
+def source_hash(filename):
+    digest = _HASH()
+    with open(filename, 'rb') as sourcefile:
+        for chunk in iter(lambda: sourcefile.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def read_cached(filename):
+    """Generates the ASTs of the top-level expressions in a file.
+
+    They are loaded from the cache when it is valid for the current source.
+    Otherwise, or if the cache cannot be read, the file is parsed, and the
+    cache written again once all of it has been read."""
+
+    digest = source_hash(filename)
+    path = cache_path(filename)
+    header = MAGIC + digest
+
+    loaded = 0
+    try:
+        cachefile = open(path, 'rb')
+    except (IOError, OSError):
+        cachefile = None
+    if cachefile is not None:
+        with cachefile:
+            count = _count(cachefile, header)
+            if count is not None:
+                try:
+                    while loaded < count:
+                        # an unpickler for each, which forgets the ASTs
+                        # loaded before, like the pickler did once dumped
+                        ast = _Unpickler(cachefile).load()
+                        loaded += 1
+                        yield ast
+                    return
+                except _BROKEN:
+                    pass
+
+    # parse the rest of the source, past anything already loaded
+    for index, ast in enumerate(_read_and_store(filename, path, header)):
+        if index >= loaded:
+            yield ast
+
+
+def _count(cachefile, header):
+    """The number of ASTs in a cache file, which is left just after the
+    header, or None if the file is not for the current source or has no
+    complete trailer."""
+
+    if cachefile.read(len(header)) != header:
+        return None
+    trailer = len(END) + _COUNT.size
+    try:
+        cachefile.seek(-trailer, os.SEEK_END)
+    except OSError:
+        return None  # shorter than a header and a trailer
+    end = cachefile.read(trailer)
+    if cachefile.tell() < len(header) + trailer or \
+            not end.startswith(END):
+        return None
+    cachefile.seek(len(header))
+    return _COUNT.unpack(end[len(END):])[0]
+
+
+def _read_and_store(filename, path, header):
+    """Reads the file, while writing its ASTs to a temporary file which
+    replaces the cache file once the whole source has been read."""
+
+    temporary = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        if not os.path.isdir(dirname(path)):
+            os.makedirs(dirname(path))
+        cachefile = open(temporary, 'wb')
+    except (IOError, OSError):
+        # read-only location, just go without the cache
+        for ast in read_file(filename):
+            yield ast
+        return
+
+    complete = False
+    try:
+        with cachefile:
+            cachefile.write(header)
+            pickler = _Pickler(cachefile, PROTOCOL)
+            count = 0
+            for ast in read_file(filename):
+                if pickler is not None:
+                    try:
+                        pickler.dump(ast)
+                    except (RecursionError, pickle.PicklingError):
+                        # too deeply nested to pickle, go without the cache
+                        pickler = None
+                    else:
+                        # so the pickler does not keep every AST alive
+                        pickler.clear_memo()
+                        count += 1
+                yield ast
+            if pickler is not None:
+                cachefile.write(END + _COUNT.pack(count))
+        complete = pickler is not None
+    finally:
+        if complete:
+            try:
+                os.replace(temporary, path)
+            except OSError:
+                pass
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+class _Pickler(pickle.Pickler):
+
+    """Pickler which keeps the symbols of ASTs apart, for `_Unpickler` to
+    intern them. Strings are pickled as UTF-8, so their contents are not
+    taken for symbols."""
+
+    def persistent_id(self, obj):
+        return obj if type(obj) is str else None
+
+    def reducer_override(self, obj):
+        if type(obj) is String:
+            return _string, (obj.val.encode('utf-8'),)
+        return NotImplemented
+
+
+def _string(utf8):
+    return String(utf8.decode('utf-8'))
+
+
+class _Unpickler(pickle.Unpickler):
+
+    """Unpickler which interns the symbols of ASTs, and refuses to create
+    anything but ASTs."""
+
+    def __init__(self, *args):
+        pickle.Unpickler.__init__(self, *args)
+        self.persistent_load = intern
+
+    def find_class(self, module, name):
+        if (module, name) == (__name__, '_string'):
+            return _string
+        raise pickle.UnpicklingError("Not an AST: %s.%s" % (module, name))
+
+
+class ParseCache(object):
+
+    """
+    Keeps the ASTs of the `size` source strings parsed most recently.
+
+    The ASTs are kept as read with `shared=True`, so they are immutable, and
+    each call gives a fresh copy made of ordinary lists, just like those
+    `parse` gives. Whatever is done to one copy, such as to the data of a
+    quoted list, is then never seen by the next.
+    """
+
+    def __init__(self, size=256):
+        self.size = size
+        self.asts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, source):
+        """Parses a single expression, like `parser.parse`."""
+
+        if self.size <= 0:
+            return parse(source)
+
+        try:
+            ast = self.asts[source]
+        except KeyError:
+            self.misses += 1
+            ast = self.asts[source] = parse(source, shared=True)
+            while len(self.asts) > self.size:
+                self.asts.popitem(last=False)
+        else:
+            self.hits += 1
+            self.asts.move_to_end(source)
+        return _copy(ast)
+
+    def clear(self):
+        self.asts.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _copy(ast):
+    # without recursion, so any depth of nesting can be copied
+    if not is_list(ast):
+        return ast
+    copy = []
+    todo = [(ast, copy)]
+    while todo:
+        node, elements = todo.pop()
+        for element in node:
+            if is_list(element):
+                inner = []
+                todo.append((element, inner))
+                element = inner
+            elements.append(element)
+    return copy
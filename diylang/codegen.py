@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+
+from . import compiler
+from .types import DiyLangError, Closure
+from .ast import is_boolean, is_atom, is_symbol, is_closure, is_integer, \
+    is_string
+from .evaluator import QUOTE, ATOM, EQ, IF, DEFINE, LET, DEFN, LAMBDA, CONS, \
+    HEAD, TAIL, EMPTY, COND, APPLY, ADD, SUBTRACT, MULTIPLY, GREATER, LESS, \
+    GREATER_OR_EQUAL, LESS_OR_EQUAL, EQUAL, OPERATORS, is_list_with, \
+    check_args_number, check_arg_list, check_apply, check_numbers, \
+    eq_values, cons_values, head_of, tail_of, is_empty, _cons
+
+"""
+An engine which evaluates DIY Lang by generating Python source for each AST,
+and running it with `exec`.
+
+Each lambda body becomes a Python function of the environment, which is
+kept with the closures made from it as `Closure.code`, just like those of
+`compiler.py`. Arithmetic, comparisons, `if` and `cond` become Python
+operators and conditional expressions. Everything else calls the same
+functions on values the evaluator uses, in the same order, so programs
+behave exactly as they do with `evaluator.evaluate`.
+
+Use `python_source` to see the source generated for an AST.
+"""
+
+# The operators which are Python operators, once both sides are numbers.
+NATIVE_OPERATORS = {
+    ADD: '+',
+    SUBTRACT: '-',
+    MULTIPLY: '*',
+    GREATER: '>',
+    LESS: '<',
+    GREATER_OR_EQUAL: '>=',
+    LESS_OR_EQUAL: '<=',
+    EQUAL: '==',
+}
+
+
+def evaluate(ast, env):
+    """Evaluate an Abstract Syntax Tree in the specified environment."""
+
+    return compile_ast(ast)(env)
+
+
+def compile_ast(ast):
+    """Compiles an AST to a Python function of the environment to evaluate
+    it in, returning its value."""
+
+    try:
+        generator = _Generator(ast)
+        code = compile(generator.source, '<diylang>', 'exec')
+    except (SyntaxError, RecursionError, MemoryError):
+        # nested too deeply for Python, compile to closures instead
+        return compiler.compile_ast(ast)
+    namespace = dict(_RUNTIME, _k=generator.constants)
+    exec(code, namespace)
+    return namespace['_main']
+
+
+def python_source(ast):
+    """The Python source `compile_ast` generates for an AST."""
+
+    return _Generator(ast).source
+
+
+class _Generator(object):
+
+    """Generates the Python module for an AST, in `source`, with a function
+    `_main` evaluating it. Any values it needs, other than numbers and
+    booleans, are kept in the list `_k`, in `constants`."""
+
+    def __init__(self, ast):
+        self.constants = []
+        self.functions = []
+        self.names = itertools.count()
+        self.function('_main', ast)
+        self.source = ''.join(self.functions)
+
+    def function(self, name, ast):
+        # function bodies are added in the order they are finished, which is
+        # fine, as none of them is called before they all are defined
+        expression = self.expression(ast, 'env')
+        self.functions.append('def %s(env):\n    return %s\n\n' %
+                              (name, expression))
+        return name
+
+    def constant(self, value):
+        if is_boolean(value):
+            return repr(value)
+        if type(value) is int:
+            return '(%r)' % value
+        self.constants.append(value)
+        return '_k[%d]' % (len(self.constants) - 1)
+
+    def temporary(self):
+        return '_t%d' % next(self.names)
+
+    def error(self, exception):
+        return '_raise(%s)' % self.constant(exception)
+
+    def expression(self, ast, env):
+        """The Python expression evaluating `ast` in the environment named
+        `env`."""
+
+        if is_boolean(ast) or is_integer(ast) or is_string(ast):
+            return self.constant(ast)
+
+        if is_symbol(ast):
+            return '%s.lookup(%s)' % (env, self.constant(ast))
+
+        if not is_list_with(ast):
+            return self.error(DiyLangError(str(ast)))
+
+        head = ast[0]
+
+        if is_symbol(head):
+            special_form = _SPECIAL_FORMS.get(head)
+            if special_form is not None:
+                try:
+                    return special_form(self, ast, env)
+                except Exception as e:
+                    return self.error(e)
+            return '_invoke(_named(%s, %s, %d), %s)' % (
+                env, self.constant(head), len(ast) - 1,
+                self.arguments(ast, env))
+
+        if is_closure(head):  # closure execution
+            function = self.constant(head)
+        elif is_atom(head):
+            return self.error(DiyLangError("not a function"))
+        else:  # direct closure invocation
+            function = self.expression(head, env)
+        return '_invoke(_function(%s, %d), %s)' % (
+            function, len(ast) - 1, self.arguments(ast, env))
+
+    def arguments(self, ast, env):
+        return '(%s)' % ''.join(self.expression(argument, env) + ', '
+                                for argument in ast[1:])
+
+    # The special forms, each generated by a method taking the list node
+    # and the name of the environment. These make the same checks the
+    # evaluator does, in the same order, but raise any error right away,
+    # for the generated code to raise again.
+
+    def quote(self, ast, env):
+        check_args_number(ast, 2, 'quote')
+        return self.constant(ast[1])
+
+    def eq(self, ast, env):
+        check_args_number(ast, 3, 'eq')
+        return '_eq_values(%s, %s)' % (self.expression(ast[1], env),
+                                       self.expression(ast[2], env))
+
+    def operator(self, ast, env):
+        check_args_number(ast, 3, ast[0])
+        left, right = self.temporary(), self.temporary()
+        checked = '_check_numbers(%s := %s, %s := %s)' % (
+            left, self.expression(ast[1], env),
+            right, self.expression(ast[2], env))
+        native = NATIVE_OPERATORS.get(ast[0])
+        if native is not None:
+            return '(%s and %s %s %s)' % (checked, left, native, right)
+        return '(%s and %s(%s, %s))' % (
+            checked, self.constant(OPERATORS[ast[0]]), left, right)
+
+    def if_(self, ast, env):
+        check_args_number(ast, 4, 'if')
+        condition, then, otherwise = [self.expression(x, env)
+                                      for x in ast[1:]]
+        return '(%s if %s else %s)' % (then, condition, otherwise)
+
+    def define(self, ast, env):
+        check_args_number(ast, 3, 'define')
+        if not is_symbol(ast[1]):
+            raise DiyLangError("not a symbol")
+        return '_define(%s, %s, %s)' % (env, self.constant(ast[1]),
+                                        self.expression(ast[2], env))
+
+    def let(self, ast, env):
+        check_args_number(ast, 3, 'let')
+        check_arg_list(ast[1], 'let')
+        steps = []
+        for p in ast[1]:
+            try:
+                check_args_number(p, 2, 'let')
+            except Exception as e:
+                steps.append(self.error(e))
+                break
+            sub_env = self.temporary()
+            steps.append('%s := %s.extend({%s: %s})' % (
+                sub_env, env, self.constant(p[0]),
+                self.expression(p[1], env)))
+            env = sub_env
+        else:
+            steps.append(self.expression(ast[2], env))
+        return '(%s)[-1]' % ''.join(step + ', ' for step in steps)
+
+    def defn(self, ast, env):
+        check_args_number(ast, 4, 'defn')
+        if not is_symbol(ast[1]):
+            raise DiyLangError('defn argument must be symbol')
+        return '_defn(%s, %s, %s)' % (
+            env, self.constant(ast[1]),
+            self.expression(_cons(LAMBDA, ast[2:]), env))
+
+    def lambda_(self, ast, env):
+        check_args_number(ast, 3, 'lambda')
+        check_arg_list(ast[1], 'lambda')
+        for p in ast[1]:
+            if not is_symbol(p):
+                raise DiyLangError('lambda argument list must be symbols')
+        code = self.function('_f%d' % next(self.names), ast[2])
+        return '_closure(%s, %s, %s, %s)' % (
+            env, self.constant(ast[1]), self.constant(ast[2]), code)
+
+    def cons(self, ast, env):
+        check_args_number(ast, 3, 'cons')
+        return '_cons_values(%s, %s)' % (self.expression(ast[1], env),
+                                         self.expression(ast[2], env))
+
+    def cond(self, ast, env):
+        check_args_number(ast, 2, 'cond')
+        check_arg_list(ast[1], 'cond')
+        clauses = []
+        for cond_ast in ast[1]:
+            try:
+                check_args_number(cond_ast, 2, 'cond')
+            except Exception as e:
+                clauses.append(self.error(e))
+                break
+            clauses.append('%s if %s else ' % (
+                self.expression(cond_ast[1], env),
+                self.expression(cond_ast[0], env)))
+        else:
+            clauses.append('False')
+        return '(%s)' % ''.join(clauses)
+
+    def apply(self, ast, env):
+        check_args_number(ast, 3, 'apply')
+        return '_apply(%s, %s)' % (self.expression(ast[1], env),
+                                   self.expression(ast[2], env))
+
+
+def _unary(name, function):
+    """Generates the special form applying `function` to one value."""
+
+    def generate_unary(generator, ast, env):
+        check_args_number(ast, 2, name)
+        return '%s(%s)' % (function, generator.expression(ast[1], env))
+    return generate_unary
+
+
+_SPECIAL_FORMS = {
+    QUOTE: _Generator.quote,
+    ATOM: _unary('atom', '_is_atom'),
+    EQ: _Generator.eq,
+    IF: _Generator.if_,
+    DEFINE: _Generator.define,
+    LET: _Generator.let,
+    DEFN: _Generator.defn,
+    LAMBDA: _Generator.lambda_,
+    CONS: _Generator.cons,
+    HEAD: _unary('head', '_head_of'),
+    TAIL: _unary('tail', '_tail_of'),
+    EMPTY: _unary('empty', '_is_empty'),
+    COND: _Generator.cond,
+    APPLY: _Generator.apply,
+}
+
+_SPECIAL_FORMS.update((symbol, _Generator.operator) for symbol in OPERATORS)
+
+
+# The functions the generated code calls.
+
+def _raise(exception):
+    raise exception.with_traceback(None)
+
+
+def _named(env, symbol, arguments):
+    closure = env.lookup(symbol)
+    if not is_closure(closure):
+        raise DiyLangError(str(symbol) + " not a function")
+    return _check_arguments(closure, arguments)
+
+
+def _function(closure, arguments):
+    if not is_closure(closure):
+        raise DiyLangError(str(closure) + " not a function")
+    return _check_arguments(closure, arguments)
+
+
+def _check_arguments(closure, arguments):
+    if len(closure.params) != arguments:
+        raise DiyLangError("wrong number of arguments, expected " +
+                           str(len(closure.params)) + " got " +
+                           str(arguments))
+    return closure
+
+
+def _invoke(closure, values):
+    code = closure.code
+    if code is None:
+        # made by the evaluator
+        code = closure.code = compile_ast(closure.body)
+    return code(closure.env.extend(dict(zip(closure.params, values))))
+
+
+def _apply(closure, values):
+    check_apply(closure, values)
+    return _invoke(closure, values)
+
+
+def _define(env, name, value):
+    env.set(name, value)
+    return value
+
+
+def _defn(env, name, closure):
+    env.set(name, closure)
+    return name
+
+
+def _closure(env, params, body, code):
+    closure = Closure(env, params, body)
+    closure.code = code
+    return closure
+
+
+_RUNTIME = {
+    '_raise': _raise,
+    '_named': _named,
+    '_function': _function,
+    '_invoke': _invoke,
+    '_apply': _apply,
+    '_define': _define,
+    '_defn': _defn,
+    '_closure': _closure,
+    '_check_numbers': check_numbers,
+    '_eq_values': eq_values,
+    '_cons_values': cons_values,
+    '_is_atom': is_atom,
+    '_head_of': head_of,
+    '_tail_of': tail_of,
+    '_is_empty': is_empty,
+}
@@ -0,0 +1,541 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+
+from .types import DiyLangError, Closure
+from .ast import is_boolean, is_atom, is_symbol, is_list, is_closure, \
+    is_integer, is_string
+from .evaluator import QUOTE, ATOM, EQ, IF, DEFINE, LET, DEFN, LAMBDA, CONS, \
+    HEAD, TAIL, EMPTY, COND, APPLY, OPERATORS, is_list_with, \
+    check_args_number, check_arg_list, check_apply, check_numbers, \
+    eq_values, cons_values, head_of, tail_of, is_empty, _cons
+
+"""
+An engine which evaluates DIY Lang by compiling each AST, once, to a tree of
+Python closures.
+
+The checks the evaluator makes of a node each time it evaluates it are made
+once, when the node is compiled. A node which fails them compiles to one
+raising the same error, whenever it is evaluated, so programs behave
+exactly as they do with `evaluator.evaluate`.
+
+The variables bound by `lambda` and `let` are resolved as they are compiled,
+to the depth of the frame they are in, counting out from the innermost one,
+and their slot in it. A frame is a list of the frame around it, followed by
+the values of its variables. Only the globals are looked up in the
+environment. Where a `define` may add variables at run time, the variables
+are bound in environments instead, just like the evaluator does, with those
+of the frames around copied into the first of them.
+
+Compiled nodes take the environment and the innermost frame, which is None
+outside of any. `compile_ast` gives functions of the environment alone.
+"""
+
+# The scopes a node is compiled in, outermost first. Each is the list of
+# names of the variables in a frame, or None if they are in an environment.
+_GLOBAL = (None,)
+
+
+def evaluate(ast, env):
+    """Evaluate an Abstract Syntax Tree in the specified environment."""
+
+    return compile_ast(ast)(env)
+
+
+def compile_ast(ast):
+    """Compiles an AST to a function of the environment to evaluate it in,
+    returning its value."""
+
+    node = _compile(ast, _GLOBAL)
+
+    def run(env):
+        return node(env, None)
+    return run
+
+
+def _compile(ast, scopes):
+    if is_boolean(ast) or is_integer(ast) or is_string(ast):
+        return _constant(ast)
+
+    if is_symbol(ast):
+        return _variable(ast, scopes)
+
+    if not is_list_with(ast):
+        return _error(DiyLangError(str(ast)))
+
+    head = ast[0]
+
+    if is_symbol(head):
+        special_form = SPECIAL_FORMS.get(head)
+        if special_form is not None:
+            try:
+                return special_form(ast, scopes)
+            except Exception as e:
+                return _error(e)
+        if _resolve(head, scopes) is None:
+            return _global_call(head, _compile_arguments(ast, scopes))
+        return _named_call(head, _variable(head, scopes),
+                           _compile_arguments(ast, scopes))
+
+    if is_closure(head):  # closure execution
+        return _call(_constant(head), _compile_arguments(ast, scopes))
+
+    if is_atom(head):
+        return _error(DiyLangError("not a function"))
+
+    # direct closure invocation
+    return _call(_compile(head, scopes), _compile_arguments(ast, scopes))
+
+
+def _compile_arguments(ast, scopes):
+    return [_compile(argument, scopes) for argument in ast[1:]]
+
+
+def _resolve(symbol, scopes):
+    """The depth of the frame a variable is in, and its slot, or None if it
+    is looked up in the environment."""
+
+    depth = 0
+    for names in reversed(scopes):
+        if names is None:
+            return None
+        for slot in range(len(names), 0, -1):
+            if names[slot - 1] == symbol:  # the last one bound wins
+                return depth, slot
+        depth += 1
+    return None
+
+
+def _frame_names(scopes):
+    """The names of the variables in each of the frames, innermost first."""
+
+    frames = []
+    for names in reversed(scopes):
+        if names is None:
+            break
+        frames.append(tuple(names))
+    return tuple(frames)
+
+
+def _bindings(frame, frame_names):
+    """The variables of the frames, as an environment would bind them."""
+
+    frames = []
+    for names in frame_names:
+        frames.append((names, frame))
+        frame = frame[0]
+    key_val = {}
+    for names, frame in reversed(frames):
+        key_val.update(zip(names, frame[1:]))
+    return key_val
+
+
+def _defines(ast):
+    """Whether evaluating `ast` may define variables, other than in the body
+    of a lambda."""
+
+    pending = [ast]
+    while pending:
+        ast = pending.pop()
+        if not is_list_with(ast):
+            continue
+        if ast[0] == DEFINE or ast[0] == DEFN:
+            return True
+        if ast[0] == QUOTE or ast[0] == LAMBDA:
+            continue
+        pending.extend(ast)
+    return False
+
+
+def _constant(value):
+    def constant(env, frame):
+        return value
+    return constant
+
+
+def _variable(symbol, scopes):
+    address = _resolve(symbol, scopes)
+    if address is None:
+        def variable(env, frame):
+            return env.lookup(symbol)
+        return variable
+
+    depth, slot = address
+    if depth == 0:
+        def local(env, frame):
+            return frame[slot]
+        return local
+    if depth == 1:
+        def enclosing(env, frame):
+            return frame[0][slot]
+        return enclosing
+
+    def outer(env, frame):
+        for _ in range(depth):
+            frame = frame[0]
+        return frame[slot]
+    return outer
+
+
+def _error(exception):
+    def error(env, frame):
+        raise exception.with_traceback(None)
+    return error
+
+
+def _named_call(symbol, variable, arguments):
+    def named_call(env, frame):
+        closure = variable(env, frame)
+        if not is_closure(closure):
+            raise DiyLangError(str(symbol) + " not a function")
+        return _invoke(closure, arguments, env, frame)
+    return named_call
+
+
+def _global_call(symbol, arguments):
+    """Compiles a call of a closure looked up in the environment, which keeps
+    the closure it found last, and the environment it was found in, as long
+    as no variable is redefined. Both are only referred to weakly, so the
+    call site does not keep them alive. While the environment is, and no
+    variable has been redefined, it still binds the closure."""
+
+    counting = INLINE_CACHES.counting
+    cached_env = cached_closure = _nothing
+    cached_version = None
+
+    def global_call(env, frame):
+        if cached_env() is env and env.version == cached_version:
+            closure = cached_closure()
+        else:
+            closure = look_up(env)
+        return _invoke(closure, arguments, env, frame)
+
+    def look_up(env):
+        nonlocal cached_env, cached_version, cached_closure
+        if counting:
+            INLINE_CACHES.misses += 1
+        closure = env.lookup(symbol)
+        if not is_closure(closure):
+            raise DiyLangError(str(symbol) + " not a function")
+        cached_env, cached_version = weakref.ref(env), env.version
+        cached_closure = weakref.ref(closure)
+        return closure
+
+    if not counting:
+        return global_call
+
+    def counted_global_call(env, frame):
+        INLINE_CACHES.calls += 1
+        return global_call(env, frame)
+    return counted_global_call
+
+
+def _nothing():
+    return None
+
+
+class InlineCacheCounters(object):
+
+    """
+    Counts the calls of globals which found the closure in the cache of the
+    call site, as hits, and those which had to look it up, as misses.
+
+    Counting slows down every call, so only the call sites compiled while
+    `counting` is set are counted.
+    """
+
+    def __init__(self):
+        self.counting = False
+        self.calls = 0
+        self.misses = 0
+
+    @property
+    def hits(self):
+        return self.calls - self.misses
+
+    def clear(self):
+        self.calls = 0
+        self.misses = 0
+
+
+INLINE_CACHES = InlineCacheCounters()
+
+
+def _call(function, arguments):
+    def call(env, frame):
+        closure = function(env, frame)
+        if not is_closure(closure):
+            raise DiyLangError(str(closure) + " not a function")
+        return _invoke(closure, arguments, env, frame)
+    return call
+
+
+def _invoke(closure, arguments, env, frame):
+    names = closure.params
+    if len(names) != len(arguments):
+        raise DiyLangError("wrong number of arguments, expected " +
+                           str(len(names)) + " got " + str(len(arguments)))
+    if type(closure) is _CompiledClosure and closure.framed:
+        values = [closure.frame]
+        for argument in arguments:
+            values.append(argument(env, frame))
+        return closure.body_code(closure.globals, values)
+    return _apply_values(closure, [argument(env, frame)
+                                   for argument in arguments])
+
+
+def _apply_values(closure, values):
+    if type(closure) is _CompiledClosure:
+        if closure.framed:
+            return closure.body_code(closure.globals,
+                                     [closure.frame, *values])
+        key_val = dict(zip(closure.params, values))
+        return closure.body_code(closure.env.extend(key_val), None)
+    code = closure.code
+    if code is None:
+        # made by another engine
+        code = closure.code = compile_ast(closure.body)
+    return code(closure.env.extend(dict(zip(closure.params, values))))
+
+
+class _CompiledClosure(Closure):
+
+    """
+    A closure made by compiled code, which keeps the frame it was made in,
+    and the environment of the globals.
+
+    Its `env`, with the variables of the frames copied into it, is made only
+    once something needs it, such as another engine calling the closure.
+    """
+
+    def __init__(self, env, frame, frame_names, params, body, body_code,
+                 framed):
+        self.globals = env
+        self.frame = frame
+        self.frame_names = frame_names
+        self.params = params
+        self.body = body
+        self.body_code = body_code
+        self.framed = framed  # whether the parameters are bound in a frame
+        self.code = None  # the body, compiled for the environment alone
+        self._env = None
+
+    @property
+    def env(self):
+        if self._env is None:
+            self._env = self.globals
+            if self.frame_names:
+                self._env = self._env.extend(
+                    _bindings(self.frame, self.frame_names))
+        return self._env
+
+
+# The special forms, each compiled by a function of the list node and the
+# scopes. These make the same checks the evaluator does, in the same order,
+# but raise any error right away, to be raised again by the compiled node.
+
+def _quote(ast, scopes):
+    check_args_number(ast, 2, 'quote')
+    return _constant(ast[1])
+
+
+def _eq(ast, scopes):
+    check_args_number(ast, 3, 'eq')
+    left, right = _compile(ast[1], scopes), _compile(ast[2], scopes)
+
+    def eq(env, frame):
+        return eq_values(left(env, frame), right(env, frame))
+    return eq
+
+
+def _operator(function):
+    def compile_operator(ast, scopes):
+        check_args_number(ast, 3, ast[0])
+        left, right = _compile(ast[1], scopes), _compile(ast[2], scopes)
+
+        def operator(env, frame):
+            left_value, right_value = left(env, frame), right(env, frame)
+            check_numbers(left_value, right_value)
+            return function(left_value, right_value)
+        return operator
+    return compile_operator
+
+
+def _if(ast, scopes):
+    check_args_number(ast, 4, 'if')
+    condition, then, otherwise = [_compile(x, scopes) for x in ast[1:]]
+
+    def if_(env, frame):
+        if condition(env, frame):
+            return then(env, frame)
+        else:
+            return otherwise(env, frame)
+    return if_
+
+
+def _define(ast, scopes):
+    check_args_number(ast, 3, 'define')
+    if not is_symbol(ast[1]):
+        raise DiyLangError("not a symbol")
+    name = ast[1]
+    value = _compile(ast[2], scopes)
+
+    def define(env, frame):
+        result = value(env, frame)
+        env.set(name, result)
+        return result
+    return define
+
+
+def _let(ast, scopes):
+    check_args_number(ast, 3, 'let')
+    check_arg_list(ast[1], 'let')
+    if _defines(ast) or not all(is_list(p) and len(p) == 2 and
+                                is_symbol(p[0]) for p in ast[1]):
+        return _environment_let(ast, scopes)
+
+    names = []
+    scopes = scopes + (names,)
+    values = []
+    for p in ast[1]:
+        values.append(_compile(p[1], scopes))
+        names.append(p[0])  # seen only by the bindings after it
+    body = _compile(ast[2], scopes)
+    size = len(values) + 1
+
+    def let(env, frame):
+        let_frame = [frame] * size
+        for slot, value in enumerate(values, 1):
+            let_frame[slot] = value(env, let_frame)
+        return body(env, let_frame)
+    return let
+
+
+def _environment_let(ast, scopes):
+    """Compiles a `let` binding its variables in environments, as it either
+    defines variables, or is not quite well-formed."""
+
+    frame_names = _frame_names(scopes)
+    scopes = scopes + (None,)
+    bindings = []
+    for p in ast[1]:
+        try:
+            check_args_number(p, 2, 'let')
+            bindings.append((p[0], _compile(p[1], scopes)))
+        except Exception as e:
+            bindings.append((None, _error(e)))
+    body = _compile(ast[2], scopes)
+
+    def let(env, frame):
+        sub_env = env
+        if frame_names:
+            sub_env = sub_env.extend(_bindings(frame, frame_names))
+        for name, value in bindings:
+            sub_env = sub_env.extend({name: value(sub_env, None)})
+        return body(sub_env, None)
+    return let
+
+
+def _defn(ast, scopes):
+    check_args_number(ast, 4, 'defn')
+    if not is_symbol(ast[1]):
+        raise DiyLangError('defn argument must be symbol')
+    name = ast[1]
+    function = _compile(_cons(LAMBDA, ast[2:]), scopes)
+
+    def defn(env, frame):
+        env.set(name, function(env, frame))
+        return name
+    return defn
+
+
+def _lambda(ast, scopes):
+    check_args_number(ast, 3, 'lambda')
+    check_arg_list(ast[1], 'lambda')
+    params = ast[1]
+    for p in params:
+        if not is_symbol(p):
+            raise DiyLangError('lambda argument list must be symbols')
+    body = ast[2]
+    frame_names = _frame_names(scopes)
+    framed = not _defines(body)
+    body_code = _compile(body, scopes + (list(params) if framed else None,))
+
+    def lambda_(env, frame):
+        return _CompiledClosure(env, frame, frame_names, params, body,
+                                body_code, framed)
+    return lambda_
+
+
+def _cons_form(ast, scopes):
+    check_args_number(ast, 3, 'cons')
+    first, following = _compile(ast[1], scopes), _compile(ast[2], scopes)
+
+    def cons(env, frame):
+        return cons_values(first(env, frame), following(env, frame))
+    return cons
+
+
+def _unary(name, function):
+    """Compiles the special form applying `function` to one value."""
+
+    def compile_unary(ast, scopes):
+        check_args_number(ast, 2, name)
+        value = _compile(ast[1], scopes)
+
+        def unary(env, frame):
+            return function(value(env, frame))
+        return unary
+    return compile_unary
+
+
+def _cond(ast, scopes):
+    check_args_number(ast, 2, 'cond')
+    check_arg_list(ast[1], 'cond')
+    clauses = []
+    for cond_ast in ast[1]:
+        try:
+            check_args_number(cond_ast, 2, 'cond')
+            clauses.append((_compile(cond_ast[0], scopes),
+                            _compile(cond_ast[1], scopes)))
+        except Exception as e:
+            clauses.append((_error(e), None))
+
+    def cond(env, frame):
+        for condition, value in clauses:
+            if condition(env, frame):
+                return value(env, frame)
+        return False
+    return cond
+
+
+def _apply(ast, scopes):
+    check_args_number(ast, 3, 'apply')
+    function, arguments = _compile(ast[1], scopes), _compile(ast[2], scopes)
+
+    def apply(env, frame):
+        closure, values = function(env, frame), arguments(env, frame)
+        check_apply(closure, values)
+        return _apply_values(closure, values)
+    return apply
+
+
+SPECIAL_FORMS = {
+    QUOTE: _quote,
+    ATOM: _unary('atom', is_atom),
+    EQ: _eq,
+    IF: _if,
+    DEFINE: _define,
+    LET: _let,
+    DEFN: _defn,
+    LAMBDA: _lambda,
+    CONS: _cons_form,
+    HEAD: _unary('head', head_of),
+    TAIL: _unary('tail', tail_of),
+    EMPTY: _unary('empty', is_empty),
+    COND: _cond,
+    APPLY: _apply,
+}
+
+SPECIAL_FORMS.update((symbol, _operator(function))
+                     for symbol, function in OPERATORS.items())
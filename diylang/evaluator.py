@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import operator
+from sys import intern
+
 from .types import DiyLangError, Closure, String
 from .ast import is_boolean, is_atom, is_symbol, is_list, is_closure, \
     is_integer, is_string
@@ -13,175 +16,348 @@ making your work a bit easier. (We're supposed to get through this thing
 in a day, after all.)
 """
 
+# The symbols of the special forms.
+QUOTE = intern('quote')
+ATOM = intern('atom')
+EQ = intern('eq')
+MOD = intern('mod')
+ADD = intern('+')
+SUBTRACT = intern('-')
+DIVIDE = intern('/')
+MULTIPLY = intern('*')
+GREATER = intern('>')
+LESS = intern('<')
+GREATER_OR_EQUAL = intern('>=')
+LESS_OR_EQUAL = intern('<=')
+EQUAL = intern('=')
+IF = intern('if')
+DEFINE = intern('define')
+LET = intern('let')
+DEFN = intern('defn')
+LAMBDA = intern('lambda')
+CONS = intern('cons')
+HEAD = intern('head')
+TAIL = intern('tail')
+EMPTY = intern('empty')
+COND = intern('cond')
+APPLY = intern('apply')
+
 
 def evaluate(ast, env):
     """Evaluate an Abstract Syntax Tree in the specified environment."""
 
     # written during exercise
 
-    if is_boolean(ast) or is_integer(ast) or is_string(ast):
-        return ast
+    # Expressions in tail position, the value of which is the value of the
+    # whole expression, are evaluated by going round this loop again rather
+    # than by calling `evaluate`, so tail calls take no Python stack.
+    while True:
+        if is_boolean(ast) or is_integer(ast) or is_string(ast):
+            return ast
 
-    if is_symbol(ast):
-        return env.lookup(ast)
+        if is_symbol(ast):
+            return env.lookup(ast)
 
-    if is_list_with(ast) and ast[0] == 'quote':
-        check_args_number(ast, 2, 'quote')
-        return ast[1]  # no evaluate
+        if not is_list_with(ast):
+            raise DiyLangError(str(ast))
 
-    if is_list_with(ast) and ast[0] == 'atom':
-        check_args_number(ast, 2, 'atom')
-        return is_atom(evaluate(ast[1], env))
+        head = ast[0]
 
-    if is_list_with_command(ast, 'eq'):
-        check_args_number(ast, 3, 'eq')
-        left, right = evaluate_two(ast[1:], env)
-        if is_list(left) or is_list(right):
-            return False
-        return left == right
+        if is_symbol(head):
+            tail_form = TAIL_FORMS.get(head)
+            if tail_form is not None:
+                ast, env = tail_form(ast, env)
+                continue
+
+            special_form = SPECIAL_FORMS.get(head)
+            if special_form is not None:
+                return special_form(ast, env)
+
+            # named closure invocation
+            closure = env.lookup(head)
+            if not is_closure(closure):
+                raise DiyLangError(str(head) + " not a function")
+
+        elif is_closure(head):  # closure execution
+            closure = head
+
+        elif is_atom(head):
+            raise DiyLangError("not a function")
+
+        else:  # direct closure invocation
+            closure = evaluate(head, env)
+            if not is_closure(closure):
+                raise DiyLangError(str(closure) + " not a function")
+
+        ast, env = closure.body, _bind(closure, ast, env)
+
+
+def apply(closure, values):
+    """Calls a closure with a list of values, binding them to its parameters
+    as they are, without evaluating them."""
+
+    env = bind_values(closure, values)
+    return evaluate(closure.body, env)
+
+
+def bind_values(closure, values):
+    """The environment to evaluate the body of a closure applied to a list of
+    values in."""
+
+    check_apply(closure, values)
+    return closure.env.extend(dict(zip(closure.params, values)))
+
+
+def check_apply(closure, values):
+    if not is_closure(closure):
+        raise DiyLangError(str(closure) + " not a function")
+    check_arg_list(values, 'apply')
+    if len(closure.params) != len(values):
+        raise DiyLangError("wrong number of arguments, expected " +
+                           str(len(closure.params)) + " got " +
+                           str(len(values)))
+
+
+def _bind(closure, ast, env):
+    """The environment to evaluate the body of a closure called by `ast` in,
+    with the arguments bound to the parameters."""
+
+    names = closure.params
+    if len(names) != len(ast) - 1:
+        raise DiyLangError("wrong number of arguments, expected " +
+                           str(len(names)) + " got " + str(len(ast) - 1))
+    key_val = {}
+    for index, name in enumerate(names, 1):
+        key_val[name] = evaluate(ast[index], env)
+    return closure.env.extend(key_val)
+
+
+# The special forms, each evaluated by a function of the list node and the
+# environment. They are found in `SPECIAL_FORMS` by the symbol at the head.
+# Those in `TAIL_FORMS` instead return the expression to evaluate next, and
+# the environment to evaluate it in.
+
+def _quote(ast, env):
+    check_args_number(ast, 2, 'quote')
+    return ast[1]  # no evaluate
 
-    if is_list_with_command(ast, 'mod'):
-        check_args_number(ast, 3, 'mod')
-        left, right = evaluate_two_numbers(ast[1:], env)
-        return left % right
 
-    if is_list_with(ast) and ast[0] in ['+', '-', '/', '*', '>']:
+def _atom(ast, env):
+    check_args_number(ast, 2, 'atom')
+    return is_atom(evaluate(ast[1], env))
+
+
+def _eq(ast, env):
+    check_args_number(ast, 3, 'eq')
+    return eq_values(*evaluate_two(ast[1:], env))
+
+
+def _operator(function):
+    """The special form applying `function` to two numbers."""
+
+    def evaluate_operator(ast, env):
         check_args_number(ast, 3, ast[0])
         left, right = evaluate_two_numbers(ast[1:], env)
-        return eval(str(left) + ast[0] + str(right))
-
-    if is_list_with_command(ast, 'if'):
-        check_args_number(ast, 4, 'if')
-        if evaluate(ast[1], env):
-            return evaluate(ast[2], env)
-        else:
-            return evaluate(ast[3], env)
-
-    if is_list_with_command(ast, 'define'):
-        check_args_number(ast, 3, 'define')
-        if not is_symbol(ast[1]):
-            # TODO message should be 'define argument must be symbol'
-            raise DiyLangError("not a symbol")
-        name = ast[1]  # new symbol
-        value = evaluate(ast[2], env)
-        env.set(name, value)
-        return value
-
-    if is_list_with_command(ast, 'let'):
-        check_args_number(ast, 3, 'let')
-        check_arg_list(ast[1], 'let')
-        sub_env = env
-        for p in ast[1]:
-            check_args_number(p, 2, 'let')
-            key_val = {p[0]: evaluate(p[1], sub_env)}
-            sub_env = sub_env.extend(key_val)
-        return evaluate(ast[2], sub_env)
-
-    if is_list_with_command(ast, 'defn'):
-        check_args_number(ast, 4, 'defn')
-        if not is_symbol(ast[1]):
-            raise DiyLangError('defn argument must be symbol')
-        name = ast[1]  # new symbol
-        closure = evaluate(_cons('lambda', ast[2:]), env)
-        env.set(name, closure)
-        return name
-
-    if is_list_with_command(ast, 'lambda'):
-        check_args_number(ast, 3, 'lambda')
-        check_arg_list(ast[1], 'lambda')
-        params = ast[1]
-        for p in params:
-            if not is_symbol(p):
-                raise DiyLangError('lambda argument list must be symbols')
-        body = ast[2]
-        return Closure(env, params, body)
-
-    if is_list_with(ast) and is_closure(ast[0]):  # closure execution
-        closure = ast[0]
-        values = ast[1:]
-        names = closure.params
-        if len(names) != len(values):
-            raise DiyLangError("wrong number of arguments, expected " +
-                               str(len(names)) + " got " + str(len(values)))
-        key_val = {}
-        for p in zip(names, values):
-            key_val[p[0]] = evaluate(p[1], env)
-        sub_env = closure.env.extend(key_val)
-        return evaluate(closure.body, sub_env)
-
-    if is_list_with_command(ast, 'cons'):
-        check_args_number(ast, 3, 'cons')
-        first, following = evaluate_two(ast[1:], env)
-        if is_list(following):
-            return _cons(first, following)
-        if is_string(first) and is_string(following):
-            return String(first.val + following.val)
-        raise DiyLangError("cons" + " arguments must be list or string")
-
-    if is_list_with_command(ast, 'head'):
-        check_args_number(ast, 2, 'head')
-        elements = evaluate(ast[1], env)
-        # now a list node would be great to use polymorphy
-        if is_list(elements):
-            if len(elements) == 0:
-                raise DiyLangError("head of empty list")
-            return elements[0]
-        if is_string(elements):
-            if len(elements.val) == 0:
-                raise DiyLangError("head of empty string")
-            return String(elements.val[0])
-        raise DiyLangError("head" + " arguments must be list or string")
-
-    if is_list_with_command(ast, 'tail'):
-        check_args_number(ast, 2, 'tail')
-        elements = evaluate(ast[1], env)
-        if is_list(elements):
-            if len(elements) == 0:
-                raise DiyLangError("tail of empty list")
-            return elements[1:]
-        if is_string(elements):
-            if len(elements.val) == 0:
-                raise DiyLangError("tail of empty string")
-            return String(elements.val[1:])
-        raise DiyLangError("tail" + " arguments must be list or string")
-
-    if is_list_with_command(ast, 'empty'):
-        check_args_number(ast, 2, 'empty')
-        elements = evaluate(ast[1], env)
-        if is_list(elements):
-            return len(elements) == 0
-        if is_string(elements):
-            return len(elements.val) == 0
-        raise DiyLangError("empty" + " arguments must be list or string")
-
-    if is_list_with_command(ast, 'cond'):
-        check_args_number(ast, 2, 'cond')
-        elements = ast[1]
-        check_arg_list(elements, 'cond')
-        for cond_ast in elements:
-            check_args_number(cond_ast, 2, 'cond')
-            if evaluate(cond_ast[0], env):
-                return evaluate(cond_ast[1], env)
-        return False
+        return function(left, right)
+    return evaluate_operator
 
-    if is_list_with(ast) and is_symbol(ast[0]):  # named closure invocation
-        closure = env.lookup(ast[0])
-        if not is_closure(closure):
-            raise DiyLangError(str(ast[0]) + " not a function")
-        replaced_ast = _cons(closure, ast[1:])
-        return evaluate(replaced_ast, env)
 
-    if is_list_with(ast) and is_atom(ast[0]):
-        raise DiyLangError("not a function")
+def _divide(left, right):
+    if right == 0:
+        raise DiyLangError("division by zero")
+    return left // right
 
-    if is_list_with(ast) and not is_atom(ast[0]):  # direct closure invocation
-        closure = evaluate(ast[0], env)
-        if not is_closure(closure):
-            raise DiyLangError(str(closure) + " not a function")
-        replaced_ast = _cons(closure, ast[1:])
-        return evaluate(replaced_ast, env)
 
-    raise DiyLangError(str(ast))
+def _modulo(left, right):
+    if right == 0:
+        raise DiyLangError("division by zero")
+    return left % right
+
+
+def _if(ast, env):
+    check_args_number(ast, 4, 'if')
+    if evaluate(ast[1], env):
+        return ast[2], env
+    else:
+        return ast[3], env
+
+
+def _define(ast, env):
+    check_args_number(ast, 3, 'define')
+    if not is_symbol(ast[1]):
+        # TODO message should be 'define argument must be symbol'
+        raise DiyLangError("not a symbol")
+    name = ast[1]  # new symbol
+    value = evaluate(ast[2], env)
+    env.set(name, value)
+    return value
+
+
+def _let(ast, env):
+    check_args_number(ast, 3, 'let')
+    check_arg_list(ast[1], 'let')
+    sub_env = env
+    for p in ast[1]:
+        check_args_number(p, 2, 'let')
+        key_val = {p[0]: evaluate(p[1], sub_env)}
+        sub_env = sub_env.extend(key_val)
+    return ast[2], sub_env
+
+
+def _defn(ast, env):
+    check_args_number(ast, 4, 'defn')
+    if not is_symbol(ast[1]):
+        raise DiyLangError('defn argument must be symbol')
+    name = ast[1]  # new symbol
+    env.set(name, _closure(ast[2], ast[3], env))
+    return name
+
+
+def _lambda(ast, env):
+    check_args_number(ast, 3, 'lambda')
+    return _closure(ast[1], ast[2], env)
+
+
+def _closure(params, body, env):
+    check_arg_list(params, 'lambda')
+    for p in params:
+        if not is_symbol(p):
+            raise DiyLangError('lambda argument list must be symbols')
+    return Closure(env, params, body)
+
+
+def _cons_form(ast, env):
+    check_args_number(ast, 3, 'cons')
+    return cons_values(*evaluate_two(ast[1:], env))
+
+
+def _head(ast, env):
+    check_args_number(ast, 2, 'head')
+    return head_of(evaluate(ast[1], env))
+
+
+def _tail(ast, env):
+    check_args_number(ast, 2, 'tail')
+    return tail_of(evaluate(ast[1], env))
+
+
+def _empty(ast, env):
+    check_args_number(ast, 2, 'empty')
+    return is_empty(evaluate(ast[1], env))
+
+
+def _cond(ast, env):
+    check_args_number(ast, 2, 'cond')
+    elements = ast[1]
+    check_arg_list(elements, 'cond')
+    for cond_ast in elements:
+        check_args_number(cond_ast, 2, 'cond')
+        if evaluate(cond_ast[0], env):
+            return cond_ast[1], env
+    return False, env
+
+
+def _apply(ast, env):
+    check_args_number(ast, 3, 'apply')
+    closure, values = evaluate_two(ast[1:], env)
+    env = bind_values(closure, values)
+    return closure.body, env
+
+
+SPECIAL_FORMS = {
+    QUOTE: _quote,
+    ATOM: _atom,
+    EQ: _eq,
+    DEFINE: _define,
+    DEFN: _defn,
+    LAMBDA: _lambda,
+    CONS: _cons_form,
+    HEAD: _head,
+    TAIL: _tail,
+    EMPTY: _empty,
+}
+
+TAIL_FORMS = {
+    IF: _if,
+    LET: _let,
+    COND: _cond,
+    APPLY: _apply,
+}
+
+# The operators on two numbers. Division is integer division, rounding down.
+OPERATORS = {
+    ADD: operator.add,
+    SUBTRACT: operator.sub,
+    MULTIPLY: operator.mul,
+    DIVIDE: _divide,
+    MOD: _modulo,
+    GREATER: operator.gt,
+    LESS: operator.lt,
+    GREATER_OR_EQUAL: operator.ge,
+    LESS_OR_EQUAL: operator.le,
+    EQUAL: operator.eq,
+}
+
+SPECIAL_FORMS.update((symbol, _operator(function))
+                     for symbol, function in OPERATORS.items())
+
+
+# What the special forms on values do, once their arguments are evaluated,
+# shared with the other engines.
+
+def eq_values(left, right):
+    if is_list(left) or is_list(right):
+        return False
+    return left == right
+
+
+def cons_values(first, following):
+    if is_list(following):
+        return _cons(first, following)
+    if is_string(first) and is_string(following):
+        return String(first.val + following.val)
+    raise DiyLangError("cons" + " arguments must be list or string")
+
+
+def head_of(elements):
+    # now a list node would be great to use polymorphy
+    if is_list(elements):
+        if len(elements) == 0:
+            raise DiyLangError("head of empty list")
+        return elements[0]
+    if is_string(elements):
+        if len(elements.val) == 0:
+            raise DiyLangError("head of empty string")
+        return String(elements.val[0])
+    raise DiyLangError("head" + " arguments must be list or string")
+
+
+def tail_of(elements):
+    if is_list(elements):
+        if len(elements) == 0:
+            raise DiyLangError("tail of empty list")
+        return elements[1:]
+    if is_string(elements):
+        if len(elements.val) == 0:
+            raise DiyLangError("tail of empty string")
+        return String(elements.val[1:])
+    raise DiyLangError("tail" + " arguments must be list or string")
+
+
+def is_empty(elements):
+    if is_list(elements):
+        return len(elements) == 0
+    if is_string(elements):
+        return len(elements.val) == 0
+    raise DiyLangError("empty" + " arguments must be list or string")
+
+
+def check_numbers(left, right):
+    if not is_integer(left):
+        raise DiyLangError(str(left))
+    if not is_integer(right):
+        raise DiyLangError(str(right))
+    return True
 
 
 def _cons(element, elements):
@@ -210,12 +386,7 @@ def check_arg_list(ast, command):
 
 def evaluate_two_numbers(ast, env):
     left, right = evaluate_two(ast, env)
-
-    if not is_integer(left):
-        raise DiyLangError(str(left))
-    if not is_integer(right):
-        raise DiyLangError(str(right))
-
+    check_numbers(left, right)
     return left, right
 
 
@@ -1,36 +1,175 @@
 # -*- coding: utf-8 -*-
 
-from .evaluator import evaluate
-from .parser import parse, unparse, parse_multiple
-from .types import Environment
+from . import codegen, compiler, evaluator, machine
+from .cache import ParseCache, read_cached
+from .parallel import read_parallel
+from .parser import index_forms, parse, unparse, unparse_to, read_stream
+from .types import DiyLangError, Environment
 
+# The ways of evaluating ASTs, by name. The tree-walking evaluator is the
+# default, `compiler` turns ASTs into Python closures first, and `codegen`
+# into Python source. The `machine` keeps a stack of its own, for recursion
+# deeper than Python's.
+ENGINES = {
+    'tree': evaluator.evaluate,
+    'closure': compiler.evaluate,
+    'python': codegen.evaluate,
+    'stack': machine.evaluate,
+}
 
-def interpret(source, env=None):
+# The ASTs of the statements interpreted most recently. Set its `size` to
+# tune it, or to 0 to turn it off. See `hits` and `misses` for how it does.
+parse_cache = ParseCache()
+
+
+def interpret(source, env=None, out=None, engine='tree'):
     """
     Interpret a DIY Lang program statement
 
     Accepts a program statement as a string, interprets it, and then
     returns the resulting DIY Lang expression as string.
+
+    Given a file object `out`, such as `sys.stdout`, the expression is
+    written to it a chunk at a time instead.
+
+    Statements are parsed through `parse_cache`, so interpreting the same
+    statement again does not parse it again.
+
+    The statement is evaluated by the engine named by `engine`, one of
+    `ENGINES`.
     """
     if env is None:
         env = Environment()
 
-    return unparse(evaluate(parse(source), env))
+    return _result(ENGINES[engine](parse_cache.parse(source), env), out)
 
 
-def interpret_file(filename, env=None):
+def interpret_file(filename, env=None, out=None, lazy=False,
+                   engine='tree', workers=None):
     """
     Interpret a DIY Lang file
 
     Accepts the name of a DIY Lang file containing a series of statements.
-    Returns the value of the last expression of the file.
+    Returns the value of the last expression of the file, or None if it has
+    none at all, such as when it is empty or only holds comments.
+
+    The parsed file is cached in a `__diycache__` directory next to it, and
+    read from there for as long as the source stays the same.
+
+    With `lazy` set, the top-level definitions of the file are only indexed,
+    and each is parsed and evaluated the first time its name is looked up.
+    Any other statement, and the last one, is evaluated right away. Errors
+    in a definition then show up when it is first used. The source is read
+    as it is then, without the cache, as only the definitions used get
+    parsed at all.
+
+    Given a number of `workers`, the file is parsed in that many processes,
+    for files too large to parse quickly on one core, and not cached. See
+    `parallel.read_parallel`. It has no effect on a `lazy` read.
     """
+    if lazy:
+        return _interpret_lazily(filename, env, out, engine)
+    if workers:
+        return _interpret_all(read_parallel(filename, workers), env, out,
+                              engine)
+    return _interpret_all(read_cached(filename), env, out, engine)
+
+
+def interpret_stream(stream, env=None, out=None, engine='tree'):
+    """
+    Interpret DIY Lang statements read from a file object
+
+    Each statement is evaluated as soon as it has been read, and only the
+    value of the latest one is kept, so this works the same for files of
+    any size and for pipes such as `sys.stdin`. Returns the value of the
+    last expression, or None if there are none.
+    """
+    return _interpret_all(read_stream(stream), env, out, engine)
+
+
+def _interpret_all(asts, env, out, engine):
     if env is None:
         env = Environment()
 
-    with open(filename, 'r') as sourcefile:
-        source = "".join(sourcefile.readlines())
+    evaluate = ENGINES[engine]
+    result = None
+    for ast in asts:
+        result = evaluate(ast, env)
+    return _result(result, out)
+
+
+def _interpret_lazily(filename, env, out, engine):
+    if env is None:
+        env = Environment()
+
+    # a copy of the source, rather than a map of the file, so the file is
+    # not held open for as long as any definition is yet to be evaluated
+    with open(filename, 'rb') as sourcefile:
+        definitions = LazyDefinitions(sourcefile.read(), env, engine=engine)
+    if env.loader is not None:
+        definitions.fallback = env.loader
+    env.loader = definitions
+
+    forms = list(index_forms(definitions.source))
+    result = None
+    for index, (start, end, name) in enumerate(forms):
+        if name is None or index == len(forms) - 1 or name in env.bindings:
+            result = definitions.evaluate(start, end)
+        elif name in definitions:
+            # redefined, which fails just like it does when loaded eagerly
+            definitions.load(name)
+            result = definitions.evaluate(start, end)
+        else:
+            definitions.forms[name] = (start, end)
+    return _result(result, out)
+
+
+class LazyDefinitions(object):
+
+    """
+    The top-level definitions of a file which have not been evaluated yet.
+
+    Installed as the `loader` of the environment the file is interpreted
+    in, which asks it for any name it has no binding for.
+    """
+
+    def __init__(self, source, env, encoding='utf-8', engine='tree'):
+        self.source = source
+        self.env = env
+        self.encoding = encoding
+        self.engine = engine
+        self.forms = {}
+        self.loaded = set()
+        self.fallback = None
+
+    def __contains__(self, symbol):
+        return symbol in self.forms or symbol in self.loaded or \
+            self.fallback is not None and symbol in self.fallback
+
+    def load(self, symbol):
+        """Evaluates the definition of `symbol`, unless it already was, and
+        returns its value."""
+
+        if symbol in self.forms:
+            start, end = self.forms.pop(symbol)
+            self.evaluate(start, end)
+            self.loaded.add(symbol)
+            if symbol not in self.env.bindings:
+                raise DiyLangError("%s not defined by: %s" % (
+                    symbol, self.source[start:end].decode(self.encoding)))
+        elif symbol not in self.loaded:
+            return self.fallback.load(symbol)
+        return self.env.bindings[symbol]
+
+    def evaluate(self, start, end):
+        source = self.source[start:end].decode(self.encoding)
+        return ENGINES[self.engine](parse(source), self.env)
+
 
-    asts = parse_multiple(source)
-    results = [evaluate(ast, env) for ast in asts]
-    return unparse(results[-1])
+def _result(ast, out):
+    if ast is None:
+        # no expression was evaluated, which is not the same as any value
+        return None
+    if out is None:
+        return unparse(ast)
+    unparse_to(ast, out)
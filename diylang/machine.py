@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+from .types import DiyLangError
+from .ast import is_boolean, is_atom, is_symbol, is_closure, is_integer, \
+    is_string
+from .evaluator import QUOTE, ATOM, EQ, IF, DEFINE, LET, DEFN, LAMBDA, CONS, \
+    HEAD, TAIL, EMPTY, COND, APPLY, OPERATORS, SPECIAL_FORMS, is_list_with, \
+    check_args_number, check_arg_list, check_numbers, eq_values, \
+    cons_values, head_of, tail_of, is_empty, bind_values
+
+"""
+An engine which evaluates DIY Lang without recursing in Python, so the depth
+of recursion in DIY Lang is limited only by memory.
+
+It is a machine going from one state to the next in a loop. Where the
+evaluator would call `evaluate` for a part of an expression, and carry on
+with its value, the machine pushes a frame with what is left to do on a
+stack of its own, and goes on to evaluate the part. Each frame is a tuple
+of a function, which is given the value once there is one, and whatever
+else it needs. Like the functions for the special forms, it returns the
+expression to evaluate next, and the environment to evaluate it in, or a
+value, and `VALUE` in place of the environment.
+"""
+
+# In place of an environment, marks the expression of a state as its value.
+VALUE = object()
+
+
+def evaluate(ast, env):
+    """Evaluate an Abstract Syntax Tree in the specified environment."""
+
+    stack = []
+    while True:
+        if env is VALUE:
+            if not stack:
+                return ast
+            frame = stack.pop()
+            ast, env = frame[0](ast, frame, stack)
+            continue
+
+        if is_boolean(ast) or is_integer(ast) or is_string(ast):
+            env = VALUE
+            continue
+
+        if is_symbol(ast):
+            ast, env = env.lookup(ast), VALUE
+            continue
+
+        if not is_list_with(ast):
+            raise DiyLangError(str(ast))
+
+        head = ast[0]
+
+        if is_symbol(head):
+            special_form = _SPECIAL_FORMS.get(head)
+            if special_form is not None:
+                ast, env = special_form(ast, env, stack)
+                continue
+
+            # named closure invocation
+            closure = env.lookup(head)
+            if not is_closure(closure):
+                raise DiyLangError(str(head) + " not a function")
+            ast, env = _call(closure, ast, env, stack)
+
+        elif is_closure(head):  # closure execution
+            ast, env = _call(head, ast, env, stack)
+
+        elif is_atom(head):
+            raise DiyLangError("not a function")
+
+        else:  # direct closure invocation
+            stack.append((_called, ast, env))
+            ast = head
+
+
+def _called(closure, frame, stack):
+    if not is_closure(closure):
+        raise DiyLangError(str(closure) + " not a function")
+    return _call(closure, frame[1], frame[2], stack)
+
+
+def _call(closure, ast, env, stack):
+    names = closure.params
+    if len(names) != len(ast) - 1:
+        raise DiyLangError("wrong number of arguments, expected " +
+                           str(len(names)) + " got " + str(len(ast) - 1))
+    if not names:
+        return closure.body, closure.env.extend({})
+    stack.append((_argument, closure, ast, env, 1, {}))
+    return ast[1], env
+
+
+def _argument(value, frame, stack):
+    _, closure, ast, env, index, key_val = frame
+    key_val[closure.params[index - 1]] = value
+    if index + 1 < len(ast):
+        stack.append((_argument, closure, ast, env, index + 1, key_val))
+        return ast[index + 1], env
+    return closure.body, closure.env.extend(key_val)
+
+
+# The special forms, each a function of the list node, the environment and
+# the stack, making the same checks the evaluator does, in the same order.
+
+def _evaluated(ast, env, stack):
+    """The special forms which evaluate no part of the node themselves."""
+
+    return SPECIAL_FORMS[ast[0]](ast, env), VALUE
+
+
+def _unary(name, function):
+    """The special form applying `function` to one value."""
+
+    def unary(ast, env, stack):
+        check_args_number(ast, 2, name)
+        stack.append((_apply_unary, function))
+        return ast[1], env
+    return unary
+
+
+def _apply_unary(value, frame, stack):
+    return frame[1](value), VALUE
+
+
+def _binary(name, function):
+    """The special form applying `function` to two values, evaluated left to
+    right. Given no name, it is that of the form."""
+
+    def binary(ast, env, stack):
+        check_args_number(ast, 3, name or ast[0])
+        stack.append((_left, ast[2], env, function))
+        return ast[1], env
+    return binary
+
+
+def _left(value, frame, stack):
+    _, right, env, function = frame
+    stack.append((_apply_binary, value, function))
+    return right, env
+
+
+def _apply_binary(value, frame, stack):
+    return frame[2](frame[1], value), VALUE
+
+
+def _numbers(function):
+    def numbers(left, right):
+        check_numbers(left, right)
+        return function(left, right)
+    return numbers
+
+
+def _if(ast, env, stack):
+    check_args_number(ast, 4, 'if')
+    stack.append((_branch, ast, env))
+    return ast[1], env
+
+
+def _branch(value, frame, stack):
+    _, ast, env = frame
+    if value:
+        return ast[2], env
+    else:
+        return ast[3], env
+
+
+def _define(ast, env, stack):
+    check_args_number(ast, 3, 'define')
+    if not is_symbol(ast[1]):
+        raise DiyLangError("not a symbol")
+    stack.append((_defined, ast[1], env))
+    return ast[2], env
+
+
+def _defined(value, frame, stack):
+    _, name, env = frame
+    env.set(name, value)
+    return value, VALUE
+
+
+def _let(ast, env, stack):
+    check_args_number(ast, 3, 'let')
+    check_arg_list(ast[1], 'let')
+    return _next_binding(ast, 0, env, stack)
+
+
+def _next_binding(ast, index, env, stack):
+    if index == len(ast[1]):
+        return ast[2], env
+    p = ast[1][index]
+    check_args_number(p, 2, 'let')
+    stack.append((_bound, ast, index, env))
+    return p[1], env
+
+
+def _bound(value, frame, stack):
+    _, ast, index, env = frame
+    sub_env = env.extend({ast[1][index][0]: value})
+    return _next_binding(ast, index + 1, sub_env, stack)
+
+
+def _cond(ast, env, stack):
+    check_args_number(ast, 2, 'cond')
+    check_arg_list(ast[1], 'cond')
+    return _next_clause(ast, 0, env, stack)
+
+
+def _next_clause(ast, index, env, stack):
+    if index == len(ast[1]):
+        return False, VALUE
+    cond_ast = ast[1][index]
+    check_args_number(cond_ast, 2, 'cond')
+    stack.append((_tested, ast, index, env))
+    return cond_ast[0], env
+
+
+def _tested(value, frame, stack):
+    _, ast, index, env = frame
+    if value:
+        return ast[1][index][1], env
+    return _next_clause(ast, index + 1, env, stack)
+
+
+def _apply(ast, env, stack):
+    check_args_number(ast, 3, 'apply')
+    stack.append((_function, ast[2], env))
+    return ast[1], env
+
+
+def _function(closure, frame, stack):
+    stack.append((_applied, closure))
+    return frame[1], frame[2]
+
+
+def _applied(values, frame, stack):
+    closure = frame[1]
+    env = bind_values(closure, values)
+    return closure.body, env
+
+
+_SPECIAL_FORMS = {
+    QUOTE: _evaluated,
+    ATOM: _unary('atom', is_atom),
+    EQ: _binary('eq', eq_values),
+    IF: _if,
+    DEFINE: _define,
+    LET: _let,
+    DEFN: _evaluated,
+    LAMBDA: _evaluated,
+    CONS: _binary('cons', cons_values),
+    HEAD: _unary('head', head_of),
+    TAIL: _unary('tail', tail_of),
+    EMPTY: _unary('empty', is_empty),
+    COND: _cond,
+    APPLY: _apply,
+}
+
+_SPECIAL_FORMS.update((symbol, _binary(None, _numbers(function)))
+                      for symbol, function in OPERATORS.items())
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import io
+import mmap
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from sys import intern
+
+from .parser import Reader, read
+from .types import DiyLangError, String
+
+"""
+Parsing of large DIY Lang files on several cores.
+
+The file is cut into batches of about the same size, each of which is parsed
+by one of a pool of worker processes, which maps the file and reads its own
+part of it. The ASTs come back pickled, with the symbols and strings of a
+batch sent once in a table of their own, so the symbols are interned again
+as they are loaded.
+
+Batches are cut where a line starts with an opening paren, which is found
+without reading the source in between. Most often that is where a top-level
+expression starts, but it may also be within a string or a nested list.
+Each worker reads its batch just like `Reader` reads a chunk of a longer
+source, and checks that the batch ends between top-level expressions. As the
+first batch starts at the start of the file, all the batches which pass the
+check start and end where reading the whole file would. Once one does not,
+the file is read in this process from the start of that batch on instead.
+"""
+
+# Smallest amount of source, in bytes, worth sending to a worker.
+MIN_BATCH_SIZE = 256 * 1024
+
+# Batches per worker, so a worker with a slow batch does not hold up others.
+BATCHES_PER_WORKER = 4
+
+
+def read_parallel(filename, workers=None, encoding='utf-8'):
+    """Generates the ASTs of the top-level expressions in a file, in order,
+    parsed by `workers` processes (by default, one per core).
+
+    The ASTs, and any errors in the source, are the same as those of
+    `read_file`."""
+
+    with open(filename, 'rb') as sourcefile:
+        size = os.fstat(sourcefile.fileno()).st_size
+        if not size:
+            return  # empty files cannot be mapped
+        mapped = mmap.mmap(sourcefile.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with closing(mapped), ProcessPoolExecutor(workers) as executor:
+        batches = [(start, end, executor.submit(_parse_batch, filename,
+                                                start, end, encoding))
+                   for start, end in _batches(mapped, size, workers or
+                                              os.cpu_count() or 1)]
+        for start, end, result in batches:
+            try:
+                result = result.result()
+            except DiyLangError:
+                # not cut between expressions, or a real error in the source
+                for future in batches:
+                    future[2].cancel()
+                for ast in read(mapped[start:].decode(encoding)):
+                    yield ast
+                return
+            for ast in _load_batch(mapped, start, end, encoding, result):
+                yield ast
+
+
+def _batches(source, size, workers):
+    """Generates the (start, end) of the batches of `source`."""
+
+    batch_size = max(MIN_BATCH_SIZE, size // (workers * BATCHES_PER_WORKER))
+    start = 0
+    while start < size:
+        end = source.find(b'\n(', start + batch_size)
+        end = size if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+def _parse_batch(filename, start, end, encoding):
+    """Parses part of a file in a worker, and returns the table of symbols
+    and strings and the pickled ASTs, or None if they are too deeply nested
+    to pickle.
+
+    Raises DiyLangError if the batch does not end between expressions."""
+
+    with open(filename, 'rb') as sourcefile:
+        mapped = mmap.mmap(sourcefile.fileno(), 0, access=mmap.ACCESS_READ)
+        with closing(mapped):
+            source = mapped[start:end].decode(encoding)
+            final = end == len(mapped)
+    reader = Reader()
+    asts = list(reader.feed(source))
+    if not final and reader.reading():
+        raise DiyLangError("Batch not cut between expressions")
+    asts.extend(reader.close())
+    stream = io.BytesIO()
+    pickler = _Pickler(stream, pickle.HIGHEST_PROTOCOL)
+    try:
+        pickler.dump(asts)
+    except (RecursionError, pickle.PicklingError):
+        return None
+    return pickler.atoms, stream.getvalue()
+
+
+def _load_batch(source, start, end, encoding, result):
+    if result is None:
+        # parse it here, so it never needs to be pickled
+        return read(source[start:end].decode(encoding))
+    atoms, data = result
+    unpickler = _Unpickler(io.BytesIO(data))
+    unpickler.persistent_load = [intern(atom) if type(atom) is str else atom
+                                 for atom in atoms].__getitem__
+    # all of it stays alive, so collecting garbage meanwhile is of no use
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return unpickler.load()
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class _Pickler(pickle.Pickler):
+
+    """Pickler which replaces each symbol and string by its index in
+    `atoms`, so the pickle proper holds neither."""
+
+    def __init__(self, *args):
+        pickle.Pickler.__init__(self, *args)
+        self.atoms = []
+        # symbols by their values, strings by their ids
+        self.indices = {}
+
+    def persistent_id(self, obj):
+        if type(obj) is str:
+            key = obj
+        elif type(obj) is String:
+            key = id(obj)
+        else:
+            return None
+        index = self.indices.get(key)
+        if index is None:
+            index = self.indices[key] = len(self.atoms)
+            self.atoms.append(obj)
+        return index
+
+
+class _Unpickler(pickle.Unpickler):
+
+    """Unpickler which refuses to create anything but ASTs."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError("Not an AST: %s.%s" % (module, name))
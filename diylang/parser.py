@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
 
+import decimal
+import mmap
+import os
 import re
-from .ast import is_boolean, is_list
-from .types import DiyLangError, String
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import closing
+from sys import intern
+
+from .ast import is_boolean, is_integer, is_list, is_symbol
+from .types import DiyLangError, SharedList, String
 
 """
 This is the parser module, with the `parse` function which you'll implement as
@@ -11,48 +19,350 @@ the evaluator can understand.
 """
 
 
-def parse(source):
+def parse(source, shared=False):
     """Parse string representation of one *single* expression
     into the corresponding Abstract Syntax Tree."""
 
-    # written during exercise
+    forms = read(source, shared)
+    try:
+        ast = next(forms)
+    except StopIteration:
+        raise DiyLangError('Expected expression')
 
-    code = remove_comments(source).strip()
+    try:
+        next(forms)
+    except StopIteration:
+        return ast
+    except DiyLangError:
+        # whatever follows the expression, it should not be there
+        pass
+    raise DiyLangError('Expected EOF')
 
-    if len(code) > 1 and code[0] == "'":
-        return ['quote', parse(code[1:])]
 
-    if len(code) == 2 and code[0] == '#':
-        if code[1] == 't':
-            return True
-        elif code[1] == 'f':
-            return False
-        raise DiyLangError('Expected boolean')
+#
+# The reader. Source is cut into tokens by one precompiled regular expression,
+# and ASTs are built from the tokens with an explicit stack of the lists still
+# open, so the source is only ever scanned once.
+#
+
+_TOKENS = re.compile(r"""
+    (\s+|;[^\n]*)             # 1: whitespace and comments
+  | (\()                      # 2: opening paren
+  | (\))                      # 3: closing paren
+  | (')                       # 4: quote
+  | ("(?:[^"]*\\")*[^"]*")    # 5: string
+  | (")                       # 6: unclosed string
+  | ([^\s()';"][^\s()';]*)    # 7: atom
+""", re.VERBOSE)
+
+_BYTE_TOKENS = re.compile(_TOKENS.pattern.encode('ascii'), re.VERBOSE)
+
+_SPACE, _OPEN, _CLOSE, _QUOTE, _STRING, _UNCLOSED, _ATOM = range(1, 8)
+
+_INTEGER = re.compile(r"\d+$")
+
+_HEX_INTEGER = re.compile(r"#x(-?[0-9a-fA-F]+)$")
+
+QUOTE = intern('quote')
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def read(source, shared=False, positions=None):
+    """Generates the ASTs of the top-level expressions in `source`,
+    in order, each as soon as it is complete."""
+
+    return Reader(shared=shared, positions=positions)._read(source, True)
 
-    if re.match(r"^\d+$", code):
-        return int(code)
 
-    if len(code) > 0 and code[0] == "\"":
-        match = re.match(r"^\"(\\\"|[^\"])*\"", code)
-        if match:
-            end = match.end()
-            if end == len(code):
-                return String(code[1:-1])
-            raise DiyLangError('Expected EOF')
+def read_file(filename, encoding='utf-8', shared=False, positions=None):
+    """Generates the ASTs of the top-level expressions in a file.
 
-        raise DiyLangError('Unclosed string')
+    The file is memory-mapped and read in place, so only the tokens are ever
+    copied out of it, and peak memory stays close to the size of the ASTs
+    however large the source is."""
 
-    if code == '()':
-        return []
+    with open(filename, 'rb') as sourcefile:
+        if not os.fstat(sourcefile.fileno()).st_size:
+            return  # empty files cannot be mapped
+        mapped = mmap.mmap(sourcefile.fileno(), 0, access=mmap.ACCESS_READ)
+        with closing(mapped):
+            reader = Reader(encoding, shared, positions)
+            for ast in reader._read(mapped, True):
+                yield ast
+
+
+def read_stream(stream, chunk_size=CHUNK_SIZE, positions=None):
+    """Generates the ASTs of the top-level expressions read from a text
+    file object, such as an open file or `sys.stdin`, without ever holding
+    more of the source than the expression being read.
+
+    Pipes and terminals are read a line at a time, so each expression is
+    available as soon as the line closing it has arrived."""
+
+    seekable = getattr(stream, 'seekable', lambda: False)
+    read_chunk = stream.read if seekable() else stream.readline
+    reader = Reader(positions=positions)
+    while True:
+        chunk = read_chunk(chunk_size)
+        if not chunk:
+            break
+        for ast in reader.feed(chunk):
+            yield ast
+    for ast in reader.close():
+        yield ast
+
+
+class Reader(object):
+
+    """
+    Reads source fed to it in chunks of any size, and generates each top-level
+    expression as soon as its last token has been fed. The generators returned
+    by `feed` and `close` must be run to the end before feeding the next chunk.
+
+    Given an `encoding`, the source is bytes, or any buffer such as an `mmap`,
+    and only the text of each atom and string is decoded.
+
+    A `shared` reader makes lists into `SharedList` tuples, and every one of
+    them, and every integer and string it reads, is one and the same object
+    as any equal one read before. Identical subtrees are then stored only
+    once, and the ASTs are immutable and hashable.
+
+    Given `positions`, the reader records where each list was read from.
+    """
+
+    def __init__(self, encoding=None, shared=False, positions=None):
+        self.encoding = encoding
+        self.positions = positions
+        # source offsets of the stack entries, kept only for `positions`
+        self.starts = []
+        # source offset where the source being read starts
+        self.offset = 0
+        # the tuples read so far, by the ids of their elements
+        self.nodes = {} if shared else None
+        # the integers and strings read so far, by their values
+        self.atoms = {} if shared else None
+        if encoding is None:
+            self.tokens = _TOKENS
+            self.pending = ""
+        else:
+            self.tokens = _BYTE_TOKENS
+            self.pending = b""
+        # lists still being built, innermost last, with None for each
+        # quote still waiting for its expression
+        self.stack = []
+        # earlier chunks of the top-level expression being read
+        self.source = []
+        # when `pending` is a string yet to be closed, the chunks fed since,
+        # which are only looked through for the end of the string
+        self.string = None
+
+    def feed(self, text):
+        """Generates the top-level expressions completed by `text`."""
+        if self.string is not None:
+            before = self.string[-1] if self.string else self.pending
+            if not self._ends_string(before[-1:], text):
+                self.string.append(text)
+                return iter(())
+        return self._read(self._pending() + text, False)
+
+    def close(self):
+        """Generates the last top-level expression, if the source ends
+        within its last token, and complains about unfinished ones."""
+        return self._read(self._pending(), True)
+
+    def _pending(self):
+        if not self.string:
+            return self.pending
+        return self.pending[:0].join([self.pending] + self.string)
+
+    def _ends_string(self, before, text):
+        # a string ends at the first '"' with no backslash before it
+        quote, escape = (b'"', b'\\') if self.encoding else ('"', '\\')
+        position = text.find(quote)
+        while position >= 0:
+            if (text[position - 1:position] if position else before) \
+                    != escape:
+                return True
+            position = text.find(quote, position + 1)
+        return False
+
+    def reading(self):
+        """Whether the source fed so far ends in the middle of an expression,
+        such as within a list or a string."""
+        return bool(self.stack) or bool(self.pending.strip())
+
+    def _read(self, source, final):
+        stack = self.stack
+        encoding = self.encoding
+        shared = self.nodes is not None
+        positions = self.positions
+        starts = self.starts
+        newline = b'\n' if encoding else '\n'
+        escape = b'\\' if encoding else '\\'
+        end = -1 if final else len(source)
+        begin = 0  # where the top-level expression being read starts
+        self.pending = source[:0]
+        self.string = None
+
+        for match in self.tokens.finditer(source):
+            kind = match.lastindex
+            if match.end() == end or not final and (
+                    kind == _UNCLOSED or
+                    kind == _STRING and match.group()[-2:-1] == escape):
+                # may be only the start of the token, try again with more
+                self.pending = source[match.start():]
+                end = match.start()
+                if kind == _UNCLOSED or kind == _STRING and \
+                        match.group()[-2:-1] == escape:
+                    self.string = []
+                break
+            elif kind == _SPACE:
+                if positions is not None:
+                    self._find_lines(source, match, newline)
+                continue
+            elif kind == _OPEN or kind == _QUOTE:
+                if not stack:
+                    begin = match.start()
+                stack.append([] if kind == _OPEN else None)
+                if positions is not None:
+                    starts.append(self.offset + match.start())
+                continue
+            elif kind == _CLOSE:
+                if not stack or stack[-1] is None:
+                    raise DiyLangError("Unexpected ')'")
+                ast = stack.pop()
+                if shared:
+                    ast = self._share_node(ast)
+                if positions is not None:
+                    positions.add(ast, starts.pop())
+            elif kind == _ATOM:
+                token = match.group()
+                if encoding:
+                    token = token.decode(encoding)
+                ast = parse_atom(token)
+                if shared and is_integer(ast):
+                    ast = self._share_atom(ast, ast)
+            elif kind == _STRING:
+                token = match.group()[1:-1]
+                if encoding:
+                    token = token.decode(encoding)
+                ast = String(token)
+                if positions is not None:
+                    self._find_lines(source, match, newline)
+                if shared:
+                    ast = self._share_atom(token, ast)
+            else:
+                raise DiyLangError('Unclosed string')
+
+            while stack and stack[-1] is None:
+                stack.pop()
+                ast = [QUOTE, ast]
+                if shared:
+                    ast = self._share_node(ast)
+                if positions is not None:
+                    positions.add(ast, starts.pop())
+            if stack:
+                stack[-1].append(ast)
+            else:
+                del self.source[:]
+                yield ast
+
+        if stack:
+            if final:
+                rest = source[begin:]
+                if encoding:
+                    rest = rest.decode(encoding)
+                raise DiyLangError("Incomplete expression: %s" %
+                                   ("".join(self.source) + rest))
+            rest = source[begin:end]
+            self.source.append(rest.decode(encoding) if encoding else rest)
+        self.offset += len(source) - len(self.pending)
+
+    def _find_lines(self, source, match, newline):
+        position = source.find(newline, match.start(), match.end())
+        while position >= 0:
+            self.positions.add_line(self.offset + position + 1)
+            position = source.find(newline, position + 1, match.end())
+
+    def _share_node(self, elements):
+        # the elements are shared already, so equal tuples have the very
+        # same elements, and need not be compared any deeper than that
+        key = tuple(map(id, elements))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = SharedList(elements)
+        return node
+
+    def _share_atom(self, value, atom):
+        # keyed by type too, as 1 == True and "1" is a string as well
+        return self.atoms.setdefault((type(atom), value), atom)
+
+
+class Positions(object):
+
+    """
+    Where in the source each list of some ASTs was read from, kept in a side
+    table so the ASTs themselves stay plain lists. Lists are known by their
+    ids, so the table is only good for as long as the ASTs are kept alive.
+    """
 
-    if len(code) > 1 and code[0] == '(':
-        closing = find_matching_paren(code, 0)
-        if closing + 1 < len(code):
-            raise DiyLangError('Expected EOF')
-        return parse_multiple(code[1:-1])
+    def __init__(self, filename=None):
+        self.filename = filename
+        # ids of the lists, and the source offsets they were read from
+        self.ids = array('Q')
+        self.offsets = array('Q')
+        # source offsets where each line starts
+        self.lines = array('Q', [0])
+        # whether `ids` is sorted, for looking up
+        self.sorted = True
+
+    def add(self, node, offset):
+        self.ids.append(id(node))
+        self.offsets.append(offset)
+        self.sorted = False
+
+    def add_line(self, offset):
+        self.lines.append(offset)
+
+    def lookup(self, node):
+        """Returns (filename, line, column) of a list of the ASTs, counting
+        from 1, or None for lists not read along with this table."""
+
+        if not self.sorted:
+            pairs = sorted(zip(self.ids, self.offsets))
+            self.ids = array('Q', (pair[0] for pair in pairs))
+            self.offsets = array('Q', (pair[1] for pair in pairs))
+            self.sorted = True
+
+        index = bisect_left(self.ids, id(node))
+        if index == len(self.ids) or self.ids[index] != id(node):
+            return None
+        offset = self.offsets[index]
+        line = bisect_right(self.lines, offset)
+        return self.filename, line, offset - self.lines[line - 1] + 1
+
+
+def parse_atom(token):
+    """Turns the text of a single atom into its AST."""
+
+    if _INTEGER.match(token):
+        return int(token)
+
+    match = _HEX_INTEGER.match(token)
+    if match:
+        return int(match.group(1), 16)
+
+    if len(token) == 2 and token[0] == '#':
+        if token[1] == 't':
+            return True
+        elif token[1] == 'f':
+            return False
+        raise DiyLangError('Expected boolean')
 
-    # symbol
-    return code
+    # symbol, interned so equal symbols are one and the same object
+    return intern(token)
 
 #
 # Below are a few useful utility functions. These should come in handy when
@@ -100,12 +410,65 @@ def split_exps(source):
         ["foo", "bar", "(baz 123)"]
     """
 
-    rest = source.strip()
-    exps = []
-    while rest:
-        exp, rest = first_expression(rest)
-        exps.append(exp)
-    return exps
+    return [source[start:end] for start, end, _ in index_forms(source)]
+
+
+def index_forms(source, encoding='utf-8', offset=0):
+    """Generates (start, end, name) for each top-level expression in
+    `source`, without parsing any of them. The expression is found in
+    `source[start:end]`, and `name` is the symbol defined by it, for `define`
+    and `defn` forms, or else None. Any source before `offset` is skipped.
+
+    The source may be a string, or bytes or any buffer such as an `mmap`, in
+    which case the offsets are in bytes."""
+
+    binary = not isinstance(source, str)
+    depth = 0
+    start = None
+    tokens = _BYTE_TOKENS if binary else _TOKENS
+    for match in tokens.finditer(source, offset):
+        kind = match.lastindex
+        if kind == _SPACE:
+            continue
+        if start is None:
+            start = match.start()
+            name = None
+            defining = False
+            # seen so far of the top-level list, if the expression is a list
+            # at all, rather than quoted or an atom
+            elements = 0 if kind == _OPEN else 2
+        if depth == 1 and elements < 2:
+            # (define name ...) or (defn name ...)
+            elements += 1
+            if kind != _ATOM:
+                defining = False
+            else:
+                token = match.group()
+                if binary:
+                    token = token.decode(encoding)
+                if elements == 1:
+                    defining = token in _DEFINITIONS
+                elif defining:
+                    name = parse_atom(token)
+        if kind == _OPEN:
+            depth += 1
+        elif kind == _CLOSE:
+            if depth == 0:
+                raise DiyLangError("Unexpected ')'")
+            depth -= 1
+        elif kind == _UNCLOSED:
+            raise DiyLangError('Unclosed string')
+        if depth == 0 and kind != _OPEN and kind != _QUOTE:
+            yield start, match.end(), name if is_symbol(name) else None
+            start = None
+
+    if start is not None:
+        rest = source[start:]
+        raise DiyLangError("Incomplete expression: %s" %
+                           (rest.decode(encoding) if binary else rest))
+
+
+_DEFINITIONS = ('define', 'defn')
 
 
 def first_expression(source):
@@ -138,7 +501,7 @@ def first_expression(source):
 #
 
 
-def parse_multiple(source):
+def parse_multiple(source, shared=False, positions=None):
     """Creates a list of ASTs from program source constituting
     multiple expressions.
 
@@ -149,20 +512,261 @@ def parse_multiple(source):
 
     """
 
-    source = remove_comments(source)
-    return [parse(exp) for exp in split_exps(source)]
+    return list(read(source, shared, positions))
 
 
-def unparse(ast):
-    """Turns an AST back into DIY Lang program source"""
+class ParsedText(object):
+
+    """
+    The ASTs of the top-level expressions in a text, along with where in
+    the text each of them is, so that after an edit only the expressions
+    that changed need to be parsed again.
+
+        > parsed = ParsedText("(define x 1) (define y 2)")
+        > parsed.edit(10, 11, "42")
+        > parsed.text
+        "(define x 42) (define y 2)"
+
+    As in a gap buffer, the offsets of the expressions past an edit are not
+    shifted right away, but only as later edits get to them. Apart from
+    copying the text, an edit then takes time in proportion to what it
+    touches, and how far it is from the edit before, rather than to the
+    length of the text.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.starts = []
+        self.ends = []
+        for start, end, _ in index_forms(text):
+            self.starts.append(start)
+            self.ends.append(end)
+        self.asts = [parse(text[start:end])
+                     for start, end in zip(self.starts, self.ends)]
+        # the offsets from index `gap` on are all `shift` short
+        self.gap = len(self.ends)
+        self.shift = 0
+        # where the last '"' of the text is, or -1
+        self.last_quote = text.rfind('"')
+
+    @property
+    def spans(self):
+        """The (start, end) of each expression in the text."""
+        return [(start, end) if index < self.gap else
+                (start + self.shift, end + self.shift)
+                for index, (start, end) in
+                enumerate(zip(self.starts, self.ends))]
+
+    def edit(self, start, end, replacement):
+        """Replaces `text[start:end]` and parses the text again where the
+        edit changed it. The ASTs of the expressions it did not touch are
+        kept as they are."""
+
+        text = self.text[:start] + replacement + self.text[end:]
+        shift = len(replacement) - (end - start)
+
+        # Expressions ending before the edit stay the same. Reading resumes
+        # at the end of the last of them, where nothing is open. A string
+        # ending in \" is the exception, which only ends there as there is
+        # no '"' after it, and goes on to the next one the edit may add.
+        first = self._find(start)
+        quote = self.last_quote
+        if 0 < quote < self._end(first - 1) and \
+                self.text[quote - 1] == '\\':
+            first = self._find(quote + 1)
+        resume = self._end(first - 1)
+
+        # Read until an expression ends past the edit where one did before,
+        # as the rest of the text is then read just the same as before.
+        spans = []
+        rest = len(self.ends)
+        for new_start, new_end, _ in index_forms(text, offset=resume):
+            spans.append((new_start, new_end))
+            if new_end >= start + len(replacement):
+                last = self._find(new_end - shift)
+                if last < rest and self._end(last) == new_end - shift:
+                    rest = last + 1
+                    break
+
+        asts = [parse(text[new_start:new_end]) for new_start, new_end in spans]
+        self._move_gap(rest)
+        self.shift += shift
+        self.starts[first:rest] = [new_start for new_start, _ in spans]
+        self.ends[first:rest] = [new_end for _, new_end in spans]
+        self.asts[first:rest] = asts
+        self.gap = first + len(spans)
+
+        if quote >= end:
+            quote += shift
+        elif '"' in replacement:
+            quote = start + replacement.rfind('"')
+        elif quote >= start:
+            # the edit took out the last '"'
+            quote = text.rfind('"', 0, start)
+        self.last_quote = quote
+        self.text = text
+
+    def _end(self, index):
+        """Where the expression at `index` ends, or 0 before the first."""
+        if index < 0:
+            return 0
+        if index < self.gap:
+            return self.ends[index]
+        return self.ends[index] + self.shift
+
+    def _find(self, position):
+        """The index of the first expression ending at `position` or after
+        it, or the number of expressions if there is none."""
+        index = bisect_left(self.ends, position, 0, self.gap)
+        if index < self.gap:
+            return index
+        return bisect_left(self.ends, position - self.shift, self.gap)
+
+    def _move_gap(self, index):
+        """Shifts the offsets between the gap and `index`, for the gap to
+        be at `index`."""
+        starts, ends, shift = self.starts, self.ends, self.shift
+        for moved in range(self.gap, index):
+            starts[moved] += shift
+            ends[moved] += shift
+        for moved in range(index, self.gap):
+            starts[moved] -= shift
+            ends[moved] -= shift
+        self.gap = index
+
+
+def unparse(ast, hexadecimal=False):
+    """Turns an AST back into DIY Lang program source
+
+    With `hexadecimal`, integers are written in hex, like #x1f or #x-1f,
+    which the reader reads back as integers."""
+
+    return "".join(_unparse(ast, hexadecimal))
+
+
+def unparse_to(ast, out, hexadecimal=False):
+    """Writes the DIY Lang program source of an AST to the file object `out`,
+    a chunk at a time, so not even huge ASTs need their source in memory."""
+
+    for chunk in _unparse(ast, hexadecimal):
+        out.write(chunk)
+
+
+def _unparse(ast, hexadecimal):
+    """Generates the source of an AST in chunks. The lists still being
+    unparsed are kept on a stack of iterators, so there is no recursion and
+    ASTs can be nested as deep as they like."""
+
+    unparse_atom = _unparse_hex_atom if hexadecimal else _unparse_atom
+    chunk = []
+    stack = []
+    separator = ""  # to go before the next element
+    while True:
+        if not is_list(ast):
+            chunk.append(separator + unparse_atom(ast))
+        elif len(ast) > 0 and ast[0] == "quote":
+            chunk.append(separator + "'")
+            separator = ""
+            ast = ast[1]
+            continue
+        elif len(ast) == 0:
+            chunk.append(separator + "()")
+        elif len(ast) <= _CHUNK_PIECES and not any(map(is_list, ast)):
+            # short lists of atoms only, such as most data, take a shortcut
+            atoms = " ".join(map(unparse_atom, ast))
+            chunk.append(separator + "(" + atoms + ")")
+        else:
+            chunk.append(separator + "(")
+            separator = ""
+            elements = iter(ast)
+            ast = next(elements)
+            stack.append(elements)
+            continue
+
+        # on to the next element, closing the lists which have none left
+        separator = " "
+        while stack:
+            ast = next(stack[-1], _END)
+            if ast is not _END:
+                break
+            stack.pop()
+            chunk.append(")")
+        else:
+            break
 
+        if len(chunk) >= _CHUNK_PIECES:
+            yield "".join(chunk)
+            chunk = []
+
+    yield "".join(chunk)
+
+
+_CHUNK_PIECES = 4096
+
+
+def _unparse_atom(ast):
     if is_boolean(ast):
         return "#t" if ast else "#f"
-    elif is_list(ast):
-        if len(ast) > 0 and ast[0] == "quote":
-            return "'%s" % unparse(ast[1])
-        else:
-            return "(%s)" % " ".join([unparse(x) for x in ast])
-    else:
-        # integers or symbols (or lambdas)
-        return str(ast)
+    if is_integer(ast):
+        return unparse_integer(ast)
+    # symbols (or lambdas)
+    return str(ast)
+
+
+def _unparse_hex_atom(ast):
+    if is_integer(ast) and not is_boolean(ast):
+        return unparse_integer(ast, True)
+    return _unparse_atom(ast)
+
+
+def unparse_integer(value, hexadecimal=False):
+    """Turns an integer of any size into source, in decimal or hex.
+
+    Python's own decimal conversion takes time quadratic in the number of
+    digits, and refuses integers with more digits than allowed by
+    `sys.set_int_max_str_digits`. Integers too big for it are converted by
+    way of `decimal.Decimal` instead."""
+
+    if hexadecimal:
+        return '#x%x' % value
+    if value.bit_length() <= _BIG_INTEGER_BITS:
+        return str(value)
+    with decimal.localcontext(_EXACT):
+        if value < 0:
+            return '-' + str(_to_decimal(-value, value.bit_length()))
+        return str(_to_decimal(value, value.bit_length()))
+
+
+# Python allows converting at least 640 digits to string, and such
+# integers are converted as fast by `str` as any other way.
+_BIG_INTEGER_BITS = 2048
+
+_EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                         Emin=decimal.MIN_EMIN, traps=[decimal.Inexact])
+
+
+def _to_decimal(value, bits):
+    """Converts an integer of `bits` bits to a Decimal, by converting its
+    upper and lower halves of bits. Only the multiplication combining them
+    does any real work, and multiplication of Decimals is sub-quadratic."""
+
+    if bits <= _BIG_INTEGER_BITS:
+        return decimal.Decimal(value)
+    low_bits = bits >> 1
+    high = value >> low_bits
+    low = value - (high << low_bits)
+    return (_to_decimal(high, bits - low_bits) * _power_of_two(low_bits) +
+            _to_decimal(low, low_bits))
+
+
+def _power_of_two(bits):
+    power = _POWERS_OF_TWO.get(bits)
+    if power is None:
+        power = _POWERS_OF_TWO[bits] = decimal.Decimal(2) ** bits
+    return power
+
+
+_POWERS_OF_TWO = {}
+
+
+_END = object()
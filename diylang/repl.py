@@ -3,9 +3,9 @@
 import os
 import sys
 
+from .interpreter import ENGINES
 from .types import DiyLangError, Environment
-from .parser import remove_comments
-from .interpreter import interpret
+from .parser import Reader, unparse_to
 
 # importing this gives readline goodness when running on systems
 # where it is supported (i.e. UNIX-y systems)
@@ -14,15 +14,10 @@ try:
 except ImportError:
     pass
 
-# Python 2 / Python 3 compatibility
-try:
-    input = raw_input
-except NameError:
-    pass
 
-
-def repl(env=None):
-    """Start the interactive Read-Eval-Print-Loop"""
+def repl(env=None, engine='tree'):
+    """Start the interactive Read-Eval-Print-Loop, evaluating with the
+    engine named by `engine`, one of `interpreter.ENGINES`."""
 
     eof = "^Z" if sys.platform[0:3] == 'win' else "^D"
 
@@ -38,48 +33,47 @@ def repl(env=None):
     if env is None:
         env = Environment()
 
+    evaluate = ENGINES[engine]
+    reader = Reader()
     while True:
         try:
-            source = read_expression()
-            print(interpret(source, env))
+            for ast in read_expressions(reader):
+                unparse_to(evaluate(ast, env), sys.stdout)
+                print("")
         except DiyLangError as e:
+            reader = Reader()
             print(colored("!", "red"))
             print(faded(str(e.__class__.__name__) + ":"))
             print(str(e))
         except KeyboardInterrupt:
+            reader = Reader()
             msg = "Interrupted. " + faded("(Use " + eof + " to exit)")
             print("\n" + colored("! ", "red") + msg)
         except EOFError:
             print(faded("\nBye! o/"))
             sys.exit(0)
         except Exception as e:
+            reader = Reader()
             print(colored("! ", "red") +
                   faded("The Python is showing through…"))
             print(faded("  " + str(e.__class__.__name__) + ":"))
             print(str(e))
 
 
-def read_expression():
-    """Read from stdin until we have at least one s-expression"""
-
-    exp = ""
-    open_parens = 0
-    while True:
-        line, parens = read_line(">  " if not exp.strip() else "…  ")
-        open_parens += parens
-        exp += line
-        if exp.strip() and open_parens <= 0:
-            break
-
-    return exp.strip()
+def read_expressions(reader):
+    """Read from stdin until we have at least one s-expression, and return
+    the ASTs of all of the expressions completed by the lines read.
 
+    The reader keeps track of where in the source it is, so each line is
+    read only once, and parens within strings are not counted."""
 
-def read_line(prompt):
-    """Return tuple of user input line and number of unclosed parens"""
-
-    line = input(colored(prompt, "reset", "dark"))
-    line = remove_comments(line + "\n")
-    return line, line.count("(") - line.count(")")
+    asts = []
+    while True:
+        prompt = "…  " if asts or reader.reading() else ">  "
+        line = input(colored(prompt, "reset", "dark"))
+        asts.extend(reader.feed(line + "\n"))
+        if asts and not reader.reading():
+            return asts
 
 
 def colored(text, color, attr=None):
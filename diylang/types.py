@@ -21,6 +21,7 @@ class Closure(object):
         self.env = env
         self.params = params
         self.body = body
+        self.code = None  # the body, once compiled by another engine
 
     def __repr__(self):
         return "<closure/%d>" % len(self.params)
@@ -30,24 +31,58 @@ class Environment(object):
 
     # written during exercise
 
-    def __init__(self, variables=None):
+    """
+    The variables bound in a scope, in `bindings`, and those of the scopes
+    around it, found through `parent`.
+
+    Extending an environment adds a scope within it, so it takes no copying,
+    however many variables there are around it. Variables in the inner scopes
+    shadow those of the same name in outer ones.
+
+    Once a variable is found, looking it up from the same environment finds
+    the same value, as `set` never binds a name already bound around it.
+    Only `redefine` changes that, and bumps `version` whenever it does, so
+    values remembered from lookups can be checked against it.
+    """
+
+    # shared by all environments, see `compiler._global_call`
+    version = 0
+
+    def __init__(self, variables=None, loader=None, parent=None):
         self.bindings = variables if variables else {}
+        # definitions yet to be evaluated, see `interpreter.LazyDefinitions`
+        self.loader = loader
+        self.parent = parent
 
     def lookup(self, symbol):
-        if symbol in self.bindings:
-            return self.bindings[symbol]
+        env = self
+        while env is not None:
+            if symbol in env.bindings:
+                return env.bindings[symbol]
+            env = env.parent
+        if self.loader is not None and symbol in self.loader:
+            return self.loader.load(symbol)
         raise DiyLangError(symbol + " not in environment")
 
     def extend(self, variables):
-        merged = self.bindings.copy()
-        merged.update(variables)
-        return Environment(merged)
+        return Environment(variables, self.loader, self)
 
     def set(self, symbol, value):
-        if symbol in self.bindings:
+        env = self
+        while env is not None:
+            if symbol in env.bindings:
+                raise DiyLangError(symbol + " already defined")
+            env = env.parent
+        if self.loader is not None and symbol in self.loader:
             raise DiyLangError(symbol + " already defined")
         self.bindings[symbol] = value
 
+    def redefine(self, symbol, value):
+        """Binds `symbol` in this scope, whether or not it already is."""
+
+        Environment.version += 1
+        self.bindings[symbol] = value
+
 
 class String(object):
 
@@ -65,3 +100,38 @@ class String(object):
 
     def __eq__(self, other):
         return isinstance(other, String) and other.val == self.val
+
+    def __hash__(self):
+        return hash(self.val)
+
+    def __reduce__(self):
+        return (String, (self.val,))
+
+
+class SharedList(tuple):
+
+    """
+    The lists of ASTs read with `shared=True`, which are immutable.
+
+    Unlike plain tuples, they tell #t and #f apart from 1 and 0, so two of
+    them are only equal, and have the same hash, when their elements have
+    the same types as well as the same values.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, SharedList):
+            return NotImplemented if not isinstance(other, tuple) else False
+        return len(self) == len(other) and _typed(self) == _typed(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(_typed(self))
+
+
+def _typed(elements):
+    return tuple((type(element), element) for element in elements)
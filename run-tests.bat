@@ -1,10 +1,9 @@
 @echo off
 rem Batch script for running the test suite.
-call set_python_path.bat
-rem calls the python package `nose` in local site-packages.
-set nosetests=call python -W ignore::DeprecationWarning -m nose
+rem Requires Python 3.8 to 3.11, as `nose` does not import on later versions,
+rem and the python packages `nose` and `pytest` to be installed.
 
-%nosetests% ^
+python -m pytest ^
 tests/test_provided_code.py ^
 tests/test_1_parsing.py ^
 tests/test_2_evaluating_simple_expressions.py ^
@@ -15,4 +14,14 @@ tests/test_6_working_with_lists.py ^
 tests/test_7_using_the_language.py ^
 tests/test_8_final_touches.py ^
 tests/test_sanity_checks.py ^
---stop
+tests/test_environment.py ^
+tests/test_interpreter.py ^
+tests/test_repl.py ^
+tests/test_cache.py ^
+tests/test_parallel.py ^
+tests/test_evaluator.py ^
+tests/test_engines.py ^
+tests/test_compiler.py ^
+tests/test_codegen.py ^
+tests/test_machine.py ^
+-x
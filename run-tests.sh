@@ -1,11 +1,12 @@
 #!/usr/bin/env bash
 
 # Bash script for running the test suite every time a file is changed.
-# Requires the python package `nose` to be installed, as well as the
+# Requires Python 3.8 to 3.11, as `nose` does not import on later versions,
+# the python packages `nose` and `pytest` to be installed, as well as the
 # `inotifytools` commands.
 
 function run_tests {
-    nosetests \
+    python3 -m pytest \
         tests/test_provided_code.py \
         tests/test_1_parsing.py \
         tests/test_2_evaluating_simple_expressions.py \
@@ -16,7 +17,17 @@ function run_tests {
         tests/test_7_using_the_language.py \
         tests/test_8_final_touches.py \
         tests/test_sanity_checks.py \
-        --stop
+        tests/test_environment.py \
+        tests/test_interpreter.py \
+        tests/test_repl.py \
+        tests/test_cache.py \
+        tests/test_parallel.py \
+        tests/test_evaluator.py \
+        tests/test_engines.py \
+        tests/test_compiler.py \
+        tests/test_codegen.py \
+        tests/test_machine.py \
+        -x
 }
 
 run_tests
@@ -1 +0,0 @@
-@set PYTHONPATH=%PYTHONPATH%;%~dp0site-packages
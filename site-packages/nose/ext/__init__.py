@@ -1,3 +0,0 @@
-"""
-External or vendor files
-"""
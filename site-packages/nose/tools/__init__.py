@@ -1,15 +0,0 @@
-"""
-Tools for testing
------------------
-
-nose.tools provides a few convenience functions to make writing tests
-easier. You don't have to use them; nothing in the rest of nose depends
-on any of these methods.
-
-"""
-from nose.tools.nontrivial import *
-from nose.tools.nontrivial import __all__ as nontrivial_all
-from nose.tools.trivial import *
-from nose.tools.trivial import __all__ as trivial_all
-
-__all__ = trivial_all + nontrivial_all
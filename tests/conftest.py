@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+import pytest
+
+from diylang.interpreter import ENGINES
+from diylang.types import Environment
+
+"""
+Lets pytest run the tests the way nose does.
+
+pytest already calls the `setup_module` and `teardown_module` of a module,
+but not the functions `nose.tools.with_setup` sets on a test.
+
+The tests of parts 2 to 8 can also be run with the other engines, in place
+of the tree-walking evaluator they were written for:
+
+    $ pytest --engine closure --engine stack
+    $ pytest --engine all
+"""
+
+# the modules of the parts which are about evaluating DIY Lang
+_PARTS = re.compile(r"test_[2-8]_")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--engine', action='append', choices=sorted(ENGINES) + ['all'],
+        help="run the tests of parts 2 to 8 with this engine, which may be "
+             "given more than once, or 'all' for every engine")
+
+
+def pytest_generate_tests(metafunc):
+    engines = metafunc.config.getoption('engine')
+    if not engines or not _PARTS.match(metafunc.module.__name__):
+        return
+    if 'all' in engines:
+        engines = sorted(ENGINES)
+    metafunc.parametrize('part_engine', engines, indirect=True)
+
+
+@pytest.fixture(autouse=True)
+def part_engine(request, monkeypatch):
+    """Has `evaluate` of the test module, and `interpret` and the like when
+    given no engine, use the engine the test is run with."""
+
+    if not hasattr(request, 'param'):
+        return 'tree'
+
+    engine = request.param
+    evaluate = ENGINES[engine]
+    if hasattr(request.module, 'evaluate'):
+        monkeypatch.setattr(request.module, 'evaluate', evaluate)
+    monkeypatch.setitem(ENGINES, 'tree', evaluate)
+    # each run of a test gets its own copy of the environment the module
+    # set up, so what one defines there is not in the way of the next
+    env = getattr(request.module, 'env', None)
+    if isinstance(env, Environment):
+        monkeypatch.setattr(request.module, 'env',
+                            Environment(dict(env.bindings)))
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def with_setup(request, part_engine):
+    function = getattr(request.node, 'function', None)
+    setup = getattr(function, 'setup', None)
+    teardown = getattr(function, 'teardown', None)
+    if setup is not None:
+        setup()
+    yield
+    if teardown is not None:
+        teardown()
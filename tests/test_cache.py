@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+from os.path import exists, join
+from sys import intern
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from diylang.cache import MAGIC, ParseCache, cache_path, read_cached, \
+    source_hash
+from diylang.interpreter import interpret, interpret_file, parse_cache
+from diylang.types import Environment, String
+
+"""
+Tests for the caches of parsed source.
+"""
+
+directory = None
+
+
+def setup_module():
+    global directory
+    directory = tempfile.mkdtemp()
+
+
+def teardown_module():
+    shutil.rmtree(directory)
+
+
+def write(name, source):
+    filename = join(directory, name)
+    with open(filename, 'w') as sourcefile:
+        sourcefile.write(source)
+    return filename
+
+
+def test_reading_a_file_writes_the_cache():
+    filename = write('read.diy', '(define foo "bar") \'(1 #t)')
+
+    assert_equals([["define", "foo", String("bar")], ["quote", [1, True]]],
+                  list(read_cached(filename)))
+    assert_true(exists(cache_path(filename)))
+    assert_equals(join(directory, '__diycache__'),
+                  os.path.dirname(cache_path(filename)))
+
+
+def test_valid_cache_is_used_instead_of_the_source():
+    filename = write('valid.diy', '(+ 1 2)')
+    list(read_cached(filename))
+
+    # tamper with the cached AST, but not with the hash of the source
+    header = len(MAGIC) + len(source_hash(filename))
+    with open(cache_path(filename), 'rb') as cachefile:
+        cached = cachefile.read()
+    with open(cache_path(filename), 'wb') as cachefile:
+        cachefile.write(cached[:header] + cached[header:].replace(b'+', b'-'))
+
+    assert_equals("-1", interpret_file(filename))
+
+
+def test_cache_is_replaced_when_the_source_changes():
+    filename = write('changed.diy', '(+ 1 2)')
+    assert_equals("3", interpret_file(filename))
+
+    write('changed.diy', '(* 2 3)')
+    assert_equals("6", interpret_file(filename))
+    assert_equals("6", interpret_file(filename))
+
+
+def test_symbols_loaded_from_the_cache_are_interned():
+    filename = write('interned.diy', '(define foo "not a symbol 0x1f")')
+    list(read_cached(filename))
+    ast = list(read_cached(filename))[0]
+
+    assert_true(ast[0] is intern('define'))
+    assert_true(ast[1] is intern('foo'))
+    assert_equals(String("not a symbol 0x1f"), ast[2])
+    assert_true(ast[2].val is not intern("not a symbol 0x1f"))
+
+
+def test_broken_cache_is_read_again_and_replaced():
+    filename = write('broken.diy', "(+ 1 2) '(a b c)")
+    header = len(MAGIC) + len(source_hash(filename))
+    list(read_cached(filename))
+    with open(cache_path(filename), 'rb') as cachefile:
+        cached = cachefile.read()
+
+    # truncated, or written with a pickle protocol this Python cannot read
+    for broken in (cached[:-3], cached[:header] + b'\x80\xff'):
+        with open(cache_path(filename), 'wb') as cachefile:
+            cachefile.write(broken)
+        assert_equals("(a b c)", interpret_file(filename))
+        with open(cache_path(filename), 'rb') as cachefile:
+            assert_equals(cached, cachefile.read())
+
+
+def test_truncated_cache_is_not_trusted_at_all():
+    filename = write('truncated.diy', "(+ 1 2) (+ 3 4)")
+    header = len(MAGIC) + len(source_hash(filename))
+    list(read_cached(filename))
+    with open(cache_path(filename), 'rb') as cachefile:
+        cached = cachefile.read()
+
+    # cut short after the first AST, which is tampered with
+    first = cached.index(b'+', header) + 1
+    with open(cache_path(filename), 'wb') as cachefile:
+        cachefile.write(cached[:header] +
+                        cached[header:first].replace(b'+', b'-'))
+
+    assert_equals([["+", 1, 2], ["+", 3, 4]], list(read_cached(filename)))
+    with open(cache_path(filename), 'rb') as cachefile:
+        assert_equals(cached, cachefile.read())
+
+
+def test_cache_broken_halfway_is_parsed_from_there_on():
+    filename = write('halfway.diy', "(+ 1 2) (* 3 4)")
+    header = len(MAGIC) + len(source_hash(filename))
+    list(read_cached(filename))
+    with open(cache_path(filename), 'rb') as cachefile:
+        cached = cachefile.read()
+
+    # the first AST is loaded from the cache, the second is broken
+    second = cached.index(b'*', header)
+    with open(cache_path(filename), 'wb') as cachefile:
+        cachefile.write(cached[:header] +
+                        cached[header:second].replace(b'+', b'-') + b'\xff' +
+                        cached[second + 1:])
+
+    assert_equals([["-", 1, 2], ["*", 3, 4]], list(read_cached(filename)))
+
+
+def test_cache_is_not_written_for_incomplete_reads():
+    filename = write('incomplete.diy', '1 2 3')
+    asts = read_cached(filename)
+    next(asts)
+    asts.close()
+
+    assert_false(exists(cache_path(filename)))
+
+
+def test_parse_cache_counts_hits_and_misses():
+    cache = ParseCache()
+    first = cache.parse("(foo '(1 2))")
+    second = cache.parse("(foo '(1 2))")
+
+    assert_equals(["foo", ["quote", [1, 2]]], first)
+    assert_equals(first, second)
+    assert_equals((1, 1), (cache.hits, cache.misses))
+
+
+def test_parse_cache_gives_a_copy_of_the_ast_each_time():
+    cache = ParseCache()
+    first = cache.parse("(foo '(1 2))")
+    first[1][1].append(3)
+    second = cache.parse("(foo '(1 2))")
+
+    assert_equals(["foo", ["quote", [1, 2]]], second)
+    assert_true(type(second[1][1]) is list)
+
+
+def test_parse_cache_copies_deeply_nested_asts():
+    depth = 100000
+    ast = ParseCache().parse("(" * depth + ")" * depth)
+    for _ in range(depth - 1):
+        ast = ast[0]
+    assert_equals([], ast)
+
+
+def test_values_are_the_same_with_and_without_the_parse_cache():
+    size = parse_cache.size
+    try:
+        for cache_size in (256, 0):
+            parse_cache.size = cache_size
+            env = Environment()
+            for _ in range(2):
+                interpret("(define x '(1 2 3))", Environment())
+            interpret("(define x '(1 2 3))", env)
+            interpret("(define y (tail x))", env)
+            assert_equals([1, 2, 3], env.lookup("x"))
+            assert_true(type(env.lookup("x")) is list)
+            assert_true(type(env.lookup("y")) is list)
+
+            # changing the data of one quoted list changes no other
+            env.lookup("x").append(99)
+            env = Environment()
+            interpret("(define x '(1 2 3))", env)
+            assert_equals([1, 2, 3], env.lookup("x"))
+    finally:
+        parse_cache.size = size
+
+
+def test_parse_cache_forgets_least_recently_used():
+    cache = ParseCache(2)
+    cache.parse("a")
+    cache.parse("b")
+    cache.parse("a")
+    cache.parse("c")
+
+    assert_equals(["a", "c"], list(cache.asts))
+
+
+def test_parse_cache_of_size_0_does_not_cache():
+    cache = ParseCache(0)
+    assert_equals(["foo"], cache.parse("(foo)"))
+    assert_equals((0, 0, 0), (cache.hits, cache.misses, len(cache.asts)))
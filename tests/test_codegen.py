@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+from os.path import dirname, join
+
+from nose.tools import assert_equals, assert_in, assert_true
+
+from diylang.codegen import compile_ast, evaluate, python_source
+from diylang.interpreter import interpret, interpret_file
+from diylang.parser import parse
+from diylang.types import Environment
+
+"""
+Tests for the engine generating Python source from ASTs. That it behaves
+exactly like the evaluator is tested in `test_engines.py`.
+"""
+
+STDLIB = join(dirname(__file__), '..', 'stdlib.diy')
+
+
+def test_arithmetic_is_generated_as_python_operators():
+    source = python_source(parse("(if (> x 1) (+ x 1) 0)"))
+    assert_in(" > ", source)
+    assert_in(" + ", source)
+    assert_in(" if ", source)
+
+
+def test_lambda_bodies_become_python_functions():
+    env = Environment()
+    evaluate(parse("(define f (lambda (x) (* x 2)))"), env)
+    code = env.lookup("f").code
+    assert_equals("_f0", code.__name__)
+    assert_equals(8, evaluate(parse("(f (f 2))"), env))
+
+
+def test_too_deeply_nested_programs_still_run():
+    code = compile_ast(parse("(+ 1 " * 300 + "0" + ")" * 300))
+    assert_equals(300, code(Environment()))
+
+
+def test_interpret_with_python_engine():
+    env = Environment()
+    interpret_file(STDLIB, env, engine='python')
+    assert_equals("(1 2 3)", interpret("(sort '(3 1 2))", env,
+                                       engine='python'))
+    assert_true(env.lookup("sort").code is not None)
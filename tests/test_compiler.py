@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import weakref
+from os.path import dirname, join
+
+from nose.tools import assert_equals, assert_raises_regexp, assert_true
+
+from diylang import evaluator
+from diylang.compiler import INLINE_CACHES, compile_ast, evaluate
+from diylang.interpreter import interpret, interpret_file
+from diylang.parser import parse
+from diylang.types import DiyLangError, Environment
+
+"""
+Tests for the engine compiling ASTs to Python closures. That it behaves
+exactly like the evaluator is tested in `test_engines.py`.
+"""
+
+STDLIB = join(dirname(__file__), '..', 'stdlib.diy')
+
+
+def test_errors_are_raised_only_when_evaluated():
+    code = compile_ast(parse("(if #t 1 (head))"))
+    assert_equals(1, code(Environment()))
+    code = compile_ast(parse("(if #f 1 (head))"))
+    for _ in range(2):
+        with assert_raises_regexp(DiyLangError, "Wrong number of arguments"):
+            code(Environment())
+
+
+def test_closure_bodies_are_compiled_once():
+    env = Environment()
+    evaluator.evaluate(parse("(define f (lambda (x) (+ x 1)))"), env)
+    assert_equals(3, evaluate(parse("(f 2)"), env))
+    code = env.lookup("f").code
+    assert_true(code is not None)
+    assert_equals(4, evaluate(parse("(f 3)"), env))
+    assert_true(env.lookup("f").code is code)
+
+
+def test_closures_made_by_the_evaluator_can_be_called():
+    env = Environment()
+    evaluator.evaluate(parse("(define f (lambda (x) (* x 2)))"), env)
+    assert_equals(4, evaluate(parse("(f 2)"), env))
+
+
+def test_interpret_with_closure_engine():
+    env = Environment()
+    interpret_file(STDLIB, env, engine='closure')
+    assert_equals("(1 2 3)", interpret("(sort '(3 1 2))", env,
+                                       engine='closure'))
+
+
+def test_compiled_closures_can_be_called_by_other_engines():
+    env = Environment()
+    evaluate(parse("""
+        (define make (lambda (a)
+                       (let ((b 2))
+                         (lambda (c) (+ a (+ b c))))))"""), env)
+    evaluate(parse("(define f (make 1))"), env)
+    assert_equals(13, evaluator.evaluate(parse("(f 10)"), env))
+    assert_equals(13, evaluate(parse("(f 10)"), env))
+
+
+def test_calls_of_globals_are_cached_until_redefined():
+    env = Environment()
+    evaluate(parse("(define f (lambda (x) (+ x 1)))"), env)
+    INLINE_CACHES.counting = True
+    try:
+        code = compile_ast(parse("(f (f 1))"))
+    finally:
+        INLINE_CACHES.counting = False
+    INLINE_CACHES.clear()
+    assert_equals(3, code(env))
+    assert_equals(3, code(env))
+    assert_equals((2, 2), (INLINE_CACHES.hits, INLINE_CACHES.misses))
+    env.redefine("f", evaluate(parse("(lambda (x) (* x 10))"), env))
+    assert_equals(100, code(env))
+    assert_equals(4, INLINE_CACHES.misses)
+
+
+def test_cached_calls_check_the_environment():
+    code = compile_ast(parse("(f)"))
+    for value in (1, 2):
+        env = Environment()
+        evaluate(parse("(define f (lambda () %d))" % value), env)
+        assert_equals(value, code(env))
+    with assert_raises_regexp(DiyLangError, "f not in environment"):
+        code(Environment())
+
+
+def test_apply_takes_any_list_of_values():
+    env = Environment()
+    source = "(apply (lambda (a b) (- a b)) '(10 3))"
+    assert_equals("7", interpret(source, env, engine='closure'))
+    assert_equals(7, evaluate(parse(source, shared=True), env))
+
+
+def test_calls_are_counted_only_when_compiled_to_count():
+    env = Environment()
+    evaluate(parse("(define f (lambda () 1))"), env)
+    code = compile_ast(parse("(f)"))
+    INLINE_CACHES.clear()
+    assert_equals(1, code(env))
+    assert_equals((0, 0), (INLINE_CACHES.hits, INLINE_CACHES.misses))
+
+
+def test_cached_calls_do_not_keep_the_environment_alive():
+    env = Environment()
+    evaluate(parse("(define f (lambda () 1))"), env)
+    code = compile_ast(parse("(f)"))
+    assert_equals(1, code(env))
+    collected = weakref.ref(env)
+    del env
+    gc.collect()
+    assert_true(collected() is None)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+from nose.tools import assert_equals, assert_raises_regexp
+
+from diylang.interpreter import ENGINES
+from diylang.parser import parse
+from diylang.types import DiyLangError, Environment
+
+"""
+Tests that every engine gives just the same values and errors as the
+tree-walking evaluator, which all the others are meant to behave like.
+"""
+
+
+def assert_same_in_all_engines(source):
+    ast = parse(source)
+    try:
+        expected = ENGINES['tree'](ast, Environment())
+    except DiyLangError as e:
+        for engine, evaluate in sorted(ENGINES.items()):
+            with assert_raises_regexp(DiyLangError, re.escape(e.args[0])):
+                evaluate(ast, Environment())
+    else:
+        for engine, evaluate in sorted(ENGINES.items()):
+            assert_equals(expected, evaluate(ast, Environment()),
+                          "%s engine: %s" % (engine, source))
+
+
+def test_engines_give_the_same_values():
+    assert_same_in_all_engines("""
+        (let ((fact (lambda (n self)
+                      (if (eq n 0) 1 (* n (self (- n 1) self))))))
+          (fact 20 fact))""")
+    assert_same_in_all_engines("(cond (((> 1 2) 'a) ((< 1 2) 'b)))")
+    assert_same_in_all_engines("(cond (((> 1 2) 'a)))")
+    assert_same_in_all_engines("(cons (head '(1 2)) (tail '(3 4)))")
+    assert_same_in_all_engines("(let ((x 2) (y (* x 3))) (mod (/ y 4) x))")
+    assert_same_in_all_engines('(cons "a" (tail "bc"))')
+    assert_same_in_all_engines("((lambda () 1))")
+
+
+def test_engines_give_the_same_errors():
+    assert_same_in_all_engines("(+ 1 #t)")
+    assert_same_in_all_engines("(+ 1 (quote x))")
+    assert_same_in_all_engines("(if 1 2)")
+    assert_same_in_all_engines("((lambda (x) x))")
+    assert_same_in_all_engines("(foo 1)")
+    assert_same_in_all_engines("(1 2)")
+    assert_same_in_all_engines("((quote x) 2)")
+    assert_same_in_all_engines("(let ((x 1) (y)) x)")
+    assert_same_in_all_engines("(lambda (1) x)")
+    assert_same_in_all_engines("(cond ((#f 1) (#t)))")
+    assert_same_in_all_engines("(/ 1 0)")
+
+
+def test_local_variables_are_bound_the_same():
+    assert_same_in_all_engines(
+        "(let ((x 1) (y (+ x 1))) ((lambda (z) (+ y z)) x))")
+    assert_same_in_all_engines("(let ((x 1)) (let ((x 2) (x (+ x 10))) x))")
+    assert_same_in_all_engines("((lambda (x x) x) 1 2)")
+    assert_same_in_all_engines(
+        "((lambda (a) ((lambda (b) ((lambda (c) (+ a (+ b c))) 3)) 2)) 1)")
+    assert_same_in_all_engines("((lambda (x) y) 1)")
+
+
+def test_variables_defined_at_run_time_are_found():
+    assert_same_in_all_engines(
+        "(let ((a 5)) (let ((b (define c a))) (+ b c)))")
+    assert_same_in_all_engines(
+        "(let ((x 1)) ((lambda () (let ((y (define z x))) (+ y z)))))")
+
+
+def test_apply_gives_the_same_values_and_errors():
+    assert_same_in_all_engines(
+        "(apply (lambda (x y) (cons y x)) '((a b) c))")
+    assert_same_in_all_engines("(apply (lambda () 1) '())")
+    assert_same_in_all_engines("(apply (lambda (x) x) '(1 2))")
+    assert_same_in_all_engines("(apply (lambda (x) x) 1)")
+    assert_same_in_all_engines("(apply 1 '(1))")
+    assert_same_in_all_engines("(apply (lambda (x) x))")
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+from nose.tools import assert_equals, assert_raises_regexp, assert_true
+
+from diylang.types import DiyLangError, Environment
+
+"""
+Tests for the environments variables are bound in, beyond those of part 4
+of the workshop.
+"""
+
+
+def test_extended_environment_sees_later_definitions_around_it():
+    env = Environment({"x": 1})
+    inner = env.extend({"y": 2})
+    env.set("z", 3)
+    assert_equals(3, inner.lookup("z"))
+    assert_equals({"y": 2}, inner.bindings)
+    with assert_raises_regexp(DiyLangError, "x already defined"):
+        inner.set("x", 4)
+    assert_equals(5, inner.extend({"x": 5}).lookup("x"))
+    assert_equals(1, inner.lookup("x"))
+
+
+def test_redefining_a_variable_bumps_the_version():
+    env = Environment({"x": 1})
+    version = env.extend({}).version
+    env.set("y", 2)
+    assert_equals(version, env.version)
+    env.redefine("x", 3)
+    assert_equals(3, env.extend({}).lookup("x"))
+    assert_true(env.extend({}).version != version)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+from nose.tools import assert_equals, assert_raises_regexp
+
+from diylang.evaluator import apply, evaluate
+from diylang.parser import parse
+from diylang.types import DiyLangError, Environment
+
+"""
+Tests for the inner workings of the evaluator, beyond the language features
+covered by the tests for each part of the workshop.
+"""
+
+
+def test_special_forms_are_recognized_in_ast_built_at_runtime():
+    """Symbols not coming from the parser are not interned, but still name
+    the same special forms."""
+
+    symbol = "".join(["i", "f"])
+    assert_equals(1, evaluate([symbol, True, 1, 2], Environment()))
+
+
+def test_comparison_operators():
+    env = Environment()
+    assert_equals(True, evaluate(["<", 2, 7], env))
+    assert_equals(False, evaluate(["<", 7, 7], env))
+    assert_equals(True, evaluate([">=", 7, 7], env))
+    assert_equals(False, evaluate([">=", 2, 7], env))
+    assert_equals(True, evaluate(["<=", 7, 7], env))
+    assert_equals(False, evaluate(["<=", 7, 2], env))
+    assert_equals(True, evaluate(["=", 7, 7], env))
+    assert_equals(False, evaluate(["=", 7, 2], env))
+
+
+def test_division_rounds_down():
+    assert_equals(-4, evaluate(["/", -7, 2], Environment()))
+    assert_equals(10 ** 30, evaluate(["/", 10 ** 31, 10], Environment()))
+
+
+def test_division_by_zero():
+    with assert_raises_regexp(DiyLangError, "division by zero"):
+        evaluate(["/", 1, 0], Environment())
+    with assert_raises_regexp(DiyLangError, "division by zero"):
+        evaluate(["mod", 1, 0], Environment())
+
+
+def test_tail_calls_take_no_python_stack():
+    env = Environment()
+    evaluate(parse("""
+        (define count
+            (lambda (n acc)
+                (cond (((eq n 0) acc)
+                       (#t (let ((m (- n 1)))
+                               (if #t (count m (+ acc 1)) #f)))))))"""), env)
+    limit = sys.getrecursionlimit()
+    assert_equals(limit * 2, evaluate(parse("(count %d 0)" % (limit * 2)),
+                                      env))
+
+
+def test_calls_leave_the_ast_as_it_is():
+    env = Environment()
+    evaluate(parse("(defn add (a b) (+ a b))"), env)
+    ast = parse("(add 1 (add 2 3))")
+    assert_equals(6, evaluate(ast, env))
+    assert_equals(["add", 1, ["add", 2, 3]], ast)
+    with assert_raises_regexp(DiyLangError,
+                              "wrong number of arguments, expected 2 got 1"):
+        evaluate(parse("(add 1)"), env)
+
+
+def test_defn_checks_parameters_like_lambda():
+    with assert_raises_regexp(DiyLangError, "must be symbols"):
+        evaluate(parse("(defn f (1) 1)"), Environment())
+    with assert_raises_regexp(DiyLangError, "lambda"):
+        evaluate(parse("(defn f 1 1)"), Environment())
+
+
+def test_apply_does_not_evaluate_the_values_again():
+    env = Environment()
+    evaluate(parse("(define swap (lambda (x y) (cons y (cons x '()))))"), env)
+    assert_equals([["b"], "a"], evaluate(parse("(apply swap '(a (b)))"), env))
+    with assert_raises_regexp(DiyLangError, "expected 2 got 1"):
+        evaluate(parse("(apply swap '(a))"), env)
+    with assert_raises_regexp(DiyLangError, "apply arguments must be list"):
+        evaluate(parse("(apply swap 'a)"), env)
+
+
+def test_host_code_can_apply_closures():
+    env = Environment()
+    evaluate(parse("(define pair (lambda (x y) (cons x (cons y '()))))"), env)
+    closure = env.lookup("pair")
+    assert_equals(["quote", [1, 2]], apply(closure, ["quote", [1, 2]]))
+    with assert_raises_regexp(DiyLangError, "1 not a function"):
+        apply(1, [])
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from io import StringIO
+
+from nose.tools import assert_equals, assert_raises_regexp, assert_true
+
+from diylang.interpreter import LazyDefinitions, interpret, interpret_file, \
+    interpret_stream
+from diylang.types import DiyLangError, Environment
+
+"""
+Tests for interpreting statements, streams and files.
+"""
+
+
+def test_interpret_stream_returns_last_value():
+    env = Environment()
+    stream = StringIO(u"(define x 41)\n(define y (+ x 1))\ny")
+    assert_equals("42", interpret_stream(stream, env))
+    assert_equals(41, env.lookup("x"))
+
+
+def test_interpret_writes_result_to_file():
+    out = StringIO()
+    assert_equals(None, interpret("'(1 (2 3))", Environment(), out))
+    assert_equals("(1 (2 3))", out.getvalue())
+
+
+def test_interpret_file_lazily_evaluates_definitions_when_used():
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    with os.fdopen(handle, 'w') as sourcefile:
+        sourcefile.write("(define x (+ y 1))\n(define y 41)\n"
+                         "(define broken missing)\n(define z 0)")
+    try:
+        env = Environment()
+        assert_equals("0", interpret_file(filename, env, lazy=True))
+        assert_equals(["z"], list(env.bindings))
+        # the source is copied, so the file is not held open meanwhile
+        assert_true(type(env.loader.source) is bytes)
+        assert_equals("42", interpret("x", env))
+        with assert_raises_regexp(DiyLangError, "already defined"):
+            interpret("(define y 1)", env)
+        with assert_raises_regexp(DiyLangError, "missing not in environment"):
+            interpret("broken", env)
+    finally:
+        os.remove(filename)
+
+
+def test_quoted_definitions_are_not_evaluated_lazily():
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    with os.fdopen(handle, 'w') as sourcefile:
+        sourcefile.write("'(define x 1)\n(define y 2)\n0")
+    try:
+        env = Environment()
+        assert_equals("0", interpret_file(filename, env, lazy=True))
+        with assert_raises_regexp(DiyLangError, "x not in environment"):
+            interpret("x", env)
+    finally:
+        os.remove(filename)
+
+
+def test_lazy_definition_which_does_not_bind_its_name_is_an_error():
+    env = Environment()
+    env.loader = LazyDefinitions(b"(+ 1 2)", env)
+    env.loader.forms["x"] = (0, 7)
+    with assert_raises_regexp(DiyLangError, r"x not defined by: \(\+ 1 2\)"):
+        env.lookup("x")
+
+
+def test_interpreting_no_expressions_gives_no_value():
+    for source in (u"", u"  ; only a comment\n"):
+        out = StringIO()
+        assert_equals(None, interpret_stream(StringIO(source)))
+        assert_equals(None, interpret_stream(StringIO(source), out=out))
+        assert_equals("", out.getvalue())
+
+        handle, filename = tempfile.mkstemp(suffix='.diy')
+        with os.fdopen(handle, 'w') as sourcefile:
+            sourcefile.write(source)
+        try:
+            assert_equals(None, interpret_file(filename))
+            assert_equals(None, interpret_file(filename, lazy=True))
+        finally:
+            os.remove(filename)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from os.path import dirname, join
+
+from nose.tools import assert_equals
+
+from diylang.interpreter import interpret, interpret_file
+from diylang.types import Environment
+
+"""
+Tests for the engine keeping a stack of its own. That it behaves exactly
+like the evaluator is tested in `test_engines.py`.
+"""
+
+STDLIB = join(dirname(__file__), '..', 'stdlib.diy')
+
+
+def test_recursion_is_not_limited_by_the_python_stack():
+    env = Environment()
+    interpret_file(STDLIB, env, engine='stack')
+    size = sys.getrecursionlimit() * 2
+    env.bindings['l'] = list(range(size))
+    assert_equals(str(size), interpret("(length l)", env, engine='stack'))
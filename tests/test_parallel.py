@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from sys import intern
+
+from nose.tools import assert_equals, assert_true
+
+from diylang import parallel
+from diylang.interpreter import interpret_file
+from diylang.parser import read_file
+
+"""
+Tests for parsing files in parallel, which must give just the same ASTs as
+reading them in one go, wherever the batches happen to be cut.
+"""
+
+batch_size = None
+
+
+def setup_module():
+    global batch_size
+    batch_size = parallel.MIN_BATCH_SIZE
+
+
+def teardown_module():
+    parallel.MIN_BATCH_SIZE = batch_size
+
+
+def read_both(source, min_batch_size):
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    with os.fdopen(handle, 'w') as sourcefile:
+        sourcefile.write(source)
+    parallel.MIN_BATCH_SIZE = min_batch_size
+    try:
+        return list(read_file(filename)), \
+            list(parallel.read_parallel(filename, 2))
+    finally:
+        parallel.MIN_BATCH_SIZE = batch_size
+        os.remove(filename)
+
+
+def test_read_parallel_gives_the_same_asts_as_read_file():
+    lines = []
+    for i in range(100):
+        lines.append("(define x%d '(%d \"s\" #t foo)) ; %d\n" % (i, i, i))
+        # lines which start within a string or a nested list
+        lines.append("(list \"a\n(b\"\n(c))\n" if i % 10 else "")
+    serial, asts = read_both("".join(lines), 100)
+    assert_equals(serial, asts)
+    assert_true(asts[-2][0] is asts[0][0])
+
+
+def test_batches_cut_within_a_string_which_still_parse():
+    # cut after a string which ends in an escaped quote, which is read as
+    # the end of the string when nothing follows it
+    serial, asts = read_both('"foo \\"\n(bar)"', 1)
+    assert_equals(serial, asts)
+
+
+def test_contents_of_strings_are_not_interned():
+    serial, asts = read_both('(foo "bar baz 0x2a")\n(qux)', 1)
+    assert_equals(serial, asts)
+    assert_true(asts[0][0] is intern("foo"))
+    assert_true(asts[0][1].val is not intern("bar baz 0x2a"))
+
+
+def test_interpret_file_parses_in_parallel_given_workers():
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    with os.fdopen(handle, 'w') as sourcefile:
+        sourcefile.write("".join("(define x%d %d)\n" % (i, i)
+                                 for i in range(100)) + "(+ x1 x99)")
+    parallel.MIN_BATCH_SIZE = 100
+    try:
+        assert_equals("100", interpret_file(filename, workers=2))
+    finally:
+        parallel.MIN_BATCH_SIZE = batch_size
+        os.remove(filename)
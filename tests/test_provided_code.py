@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
 
-from nose.tools import assert_equals, assert_raises_regexp, assert_raises
+import math
+import os
+import sys
+import tempfile
+from io import StringIO
 
-from diylang.parser import unparse, find_matching_paren
-from diylang.types import DiyLangError
+from nose.tools import assert_equals, assert_raises_regexp, assert_raises, \
+    assert_true
+
+from diylang.parser import unparse, find_matching_paren, parse, \
+    parse_multiple, split_exps, Reader, read_file, Positions, unparse_to, \
+    index_forms, ParsedText
+from diylang.types import DiyLangError, SharedList, String
 
 """
 This module contains a few tests for the code provided for part 1.
@@ -39,6 +48,197 @@ def test_find_matching_paren_throws_exception_on_no_closing_paren():
     with assert_raises_regexp(DiyLangError, "Incomplete expression"):
         find_matching_paren("string (without closing paren", 7)
 
+# Tests for the reader behind parse and parse_multiple in parser.py
+
+
+def test_parse_multiple():
+    source = "(foo 'bar) ; a comment\n 42 #t"
+    assert_equals([["foo", ["quote", "bar"]], 42, True],
+                  parse_multiple(source))
+
+
+def test_parse_multiple_of_nothing():
+    assert_equals([], parse_multiple(" ; only a comment"))
+
+
+def test_parse_multiple_reports_incomplete_expression():
+    with assert_raises_regexp(DiyLangError, r"Incomplete expression: \(bar"):
+        parse_multiple("(foo) (bar (baz)")
+
+
+def test_parse_deeply_nested_list():
+    depth = 10000
+    ast = parse("(" * depth + ")" * depth)
+    for _ in range(depth - 1):
+        ast = ast[0]
+    assert_equals([], ast)
+
+
+def test_parse_strings_with_backslashes():
+    assert_equals(String('say \\"hi\\"'), parse('"say \\"hi\\""'))
+    assert_equals(String('ends with \\'), parse('"ends with \\"'))
+    assert_equals([String('a \\" b')], parse_multiple('"a \\" b"'))
+
+
+def test_parse_interns_symbols():
+    ast = parse("(foo (foo 'bar))")
+    assert ast[0] is ast[1][0]
+    assert ast[1][1][0] is parse("'x")[0]
+
+
+def test_shared_parse_stores_identical_subtrees_once():
+    source = "(foo (bar 1) (bar 1) \"baz\" \"baz\" '(bar 1))"
+    ast = parse(source, shared=True)
+    assert_equals(source, unparse(ast))
+    assert_true(type(ast) is SharedList)
+    assert ast[1] is ast[2] is ast[5][1]
+    assert ast[3] is ast[4]
+
+
+def test_shared_asts_are_hashable():
+    first, second, third = parse_multiple("(a (b)) (a (b)) (a (c))", True)
+    assert_equals(hash(first), hash(second))
+    assert_equals({first: 1, third: 2}, {second: 1, third: 2})
+
+
+def test_shared_asts_tell_booleans_from_integers():
+    asts = parse_multiple("(a #t) (a 1) (a #f) (a 0) (a (#t)) (a (1))", True)
+    for index, ast in enumerate(asts):
+        for other in asts[index + 1:]:
+            assert_true(ast != other)
+            assert_true(hash(ast) != hash(other))
+    assert_equals(asts[0], parse("(a #t)", shared=True))
+    assert_true(asts[0] != ("a", True))
+
+
+def test_positions_of_lists():
+    source = '(define f ; comment\n  (lambda (x)\n    "a\nb" \'(q)))\n(f 1)'
+    positions = Positions("f.diy")
+    define, call = parse_multiple(source, positions=positions)
+
+    assert_equals(("f.diy", 1, 1), positions.lookup(define))
+    assert_equals(("f.diy", 2, 3), positions.lookup(define[2]))
+    assert_equals(("f.diy", 2, 11), positions.lookup(define[2][1]))
+    assert_equals(("f.diy", 4, 4), positions.lookup(define[2][3]))
+    assert_equals(("f.diy", 4, 5), positions.lookup(define[2][3][1]))
+    assert_equals(("f.diy", 5, 1), positions.lookup(call))
+    assert_equals(None, positions.lookup(["f", 1]))
+
+
+def test_split_exps():
+    assert_equals(["foo", "bar", "(baz 123)", "'(x \")\")"],
+                  split_exps("foo bar (baz 123) '(x \")\")"))
+
+
+def test_split_exps_reports_incomplete_expression():
+    with assert_raises_regexp(DiyLangError, "Incomplete expression"):
+        split_exps("foo (bar")
+
+
+def test_index_forms_names_definitions():
+    source = b"(define x 1) ; x\n(defn f (y) y)\n(f x) 'g"
+    assert_equals([(0, 12, "x"), (17, 31, "f"), (32, 37, None),
+                   (38, 40, None)],
+                  list(index_forms(source)))
+
+
+def test_index_forms_does_not_name_quoted_definitions():
+    source = "'(define x 1) '(defn f (y) y) define"
+    assert_equals([(0, 13, None), (14, 29, None), (30, 36, None)],
+                  list(index_forms(source)))
+
+
+def test_parsed_text_reparses_only_edited_expressions():
+    parsed = ParsedText("(foo 1) (bar 2) ; comment\n'(baz 3)")
+    foo, bar, baz = parsed.asts
+    parsed.edit(10, 12, "ar (qux)")
+    assert_equals("(foo 1) (bar (qux) 2) ; comment\n'(baz 3)", parsed.text)
+    assert_equals(parse_multiple(parsed.text), parsed.asts)
+    assert_true(parsed.asts[0] is foo)
+    assert_true(parsed.asts[2] is baz)
+
+
+def test_parsed_text_edit_may_join_expressions():
+    parsed = ParsedText("foo bar (baz)")
+    baz = parsed.asts[2]
+    parsed.edit(3, 4, "")
+    assert_equals(["foobar", ["baz"]], parsed.asts)
+    assert_true(parsed.asts[1] is baz)
+    assert_equals([(0, 6), (7, 12)], parsed.spans)
+
+
+def test_parsed_text_edit_may_go_on_with_a_string_before_it():
+    # the string ends in \" only until the edit adds another '"'
+    text = ' ";b1\'a\'ax y)1\\\\"\\\\'
+    parsed = ParsedText(text)
+    parsed.edit(18, 19, 'x yx y)" ')
+    assert_equals(parse_multiple(parsed.text), parsed.asts)
+    assert_equals(1, len(parsed.asts))
+
+
+def test_parsed_text_keeps_track_of_many_edits():
+    parsed = ParsedText("(a 1) (b 2) (c 3) (d 4)")
+    parsed.edit(19, 20, "dd")
+    parsed.edit(1, 2, "aaa")
+    parsed.edit(15, 16, "(x)")
+    parsed.edit(0, 8, "")
+    assert_equals("(b 2) ((x) 3) (dd 4)", parsed.text)
+    assert_equals(parse_multiple(parsed.text), parsed.asts)
+    assert_equals([(0, 5), (6, 13), (14, 20)], parsed.spans)
+
+
+def test_reader_accepts_source_in_chunks_of_any_size():
+    source = "(foo \"bar \\\" (\" 'baz) 123 ; comment\n qux"
+    for size in range(1, len(source) + 1):
+        reader = Reader()
+        asts = []
+        for start in range(0, len(source), size):
+            asts.extend(reader.feed(source[start:start + size]))
+        asts.extend(reader.close())
+        assert_equals(parse_multiple(source), asts)
+
+
+def test_reader_only_looks_for_the_end_of_a_string_left_open():
+    reader = Reader()
+    assert_equals([], list(reader.feed("(foo \"bar \\")))
+    pending = reader.pending
+    for _ in range(100):
+        assert_equals([], list(reader.feed("\" (baz) \\")))
+    # the start of the string is not read again with each chunk
+    assert_true(reader.pending is pending)
+    assert_equals([["foo", String("bar \\" + "\" (baz) \\" * 100 + "\"")]],
+                  list(reader.feed("\"\") ")))
+
+
+def test_reader_reads_a_string_closed_at_the_end_of_a_chunk():
+    for encoding, chunks in ((None, ('"foo"', ' x')),
+                             ('utf-8', (b'"foo"', b' x'))):
+        reader = Reader(encoding)
+        assert_equals([], list(reader.feed(chunks[0])))
+        assert_equals([String("foo")], list(reader.feed(chunks[1])))
+        assert_equals(["x"], list(reader.close()))
+
+
+def test_reader_generates_expressions_as_soon_as_they_are_complete():
+    reader = Reader()
+    assert_equals([], list(reader.feed("(foo (bar)")))
+    assert_equals([["foo", ["bar"]]], list(reader.feed(") (baz")))
+    with assert_raises_regexp(DiyLangError, r"Incomplete expression: \(baz"):
+        list(reader.close())
+
+
+def test_read_file():
+    handle, filename = tempfile.mkstemp(suffix='.diy')
+    with os.fdopen(handle, 'wb') as sourcefile:
+        source = u"(foo 'b\u00e6r) ; comment\n\"bl\u00e5\""
+        sourcefile.write(source.encode('utf-8'))
+    try:
+        assert_equals([["foo", ["quote", u"b\u00e6r"]], String(u"bl\u00e5")],
+                      list(read_file(filename)))
+    finally:
+        os.remove(filename)
+
+
 # Tests for unparse in parser.py
 
 
@@ -69,6 +269,30 @@ def test_unparse_int():
     assert_equals("-42", unparse(-42))
 
 
+def test_unparse_huge_int():
+    value = math.factorial(5000)
+    text = unparse(value)
+    limit = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    set_limit = getattr(sys, 'set_int_max_str_digits', lambda digits: None)
+    set_limit(0)
+    try:
+        assert_equals(str(value), text)
+        assert_equals("-" + str(value), unparse(-value))
+    finally:
+        set_limit(limit)
+
+
+def test_unparse_hex_int():
+    assert_equals("(#xff #x-10 #t)", unparse([255, -16, True], True))
+
+
+def test_unparse_gives_source_which_parses_back():
+    ast = ["quote", [255, math.factorial(500), ["foo", True], [], False]]
+    assert_equals(ast, parse(unparse(ast)))
+    assert_equals(ast, parse(unparse(ast, True)))
+    assert_equals([-16, "#xg"], parse("(#x-10 #xg)"))
+
+
 def test_unparse_symbol():
     assert_equals("+", unparse("+"))
     assert_equals("foo", unparse("foo"))
@@ -89,3 +313,18 @@ def test_unparse_other_quotes():
 
 def test_unparse_empty_list():
     assert_equals("()", unparse([]))
+
+
+def test_unparse_deeply_nested_list():
+    depth = 100000
+    ast = []
+    for _ in range(depth):
+        ast = [ast, "x"]
+    assert_equals("(" * depth + "()" + " x)" * depth, unparse(ast))
+
+
+def test_unparse_to_file():
+    out = StringIO()
+    ast = [["quote", list(range(10000))], [], [True, ["foo"]]]
+    unparse_to(ast, out)
+    assert_equals(unparse(ast), out.getvalue())
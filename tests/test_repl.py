@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from nose.tools import assert_equals
+
+from diylang import repl
+from diylang.parser import Reader
+from diylang.types import String
+
+"""
+Tests for reading the expressions typed into the REPL.
+"""
+
+
+def read_from_lines(lines, reader):
+    lines = iter(lines)
+    original = vars(repl).get('input')
+    repl.input = lambda prompt: next(lines)
+    try:
+        return repl.read_expressions(reader)
+    finally:
+        if original is None:
+            del repl.input
+        else:
+            repl.input = original
+
+
+def test_repl_reads_until_expression_is_complete():
+    reader = Reader()
+    lines = ['(define s "a ) string', 'with ( parens")', "'done"]
+    assert_equals([["define", "s", String("a ) string\nwith ( parens")]],
+                  read_from_lines(lines, reader))
+    assert_equals([["quote", "done"]], read_from_lines(lines[2:], reader))
+
+
+def test_repl_reads_all_expressions_on_a_line():
+    lines = ["1 (foo", "bar) 2 ; three"]
+    assert_equals([1, ["foo", "bar"], 2], read_from_lines(lines, Reader()))